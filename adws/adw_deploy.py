@@ -154,10 +154,14 @@ def deploy_infrastructure(
 
     # Load CDK configuration to get stack names
     import yaml
+    try:
+        from yaml import CSafeLoader as YamlSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlSafeLoader
 
     cdk_config_file = cdk_app_dir / "cdk_config.yaml"
     with open(cdk_config_file, "r") as f:
-        cdk_config = yaml.safe_load(f)
+        cdk_config = yaml.load(f, Loader=YamlSafeLoader)
 
     # Get stack name from config
     stack_name = cdk_config.get("stack_name", f"{adw_id}-{environment}-stack")
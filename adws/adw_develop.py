@@ -26,6 +26,12 @@ from pathlib import Path
 from dotenv import load_dotenv
 from typing import Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -63,7 +69,7 @@ def find_story_details(story_id: str, stories_path: str, logger: logging.Logger)
     """
     try:
         with open(stories_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlSafeLoader)
 
         stories = data.get('stories', [])
         for story in stories:
@@ -191,20 +191,27 @@ def parse_jsonl_output(
         return [], None
 
 
-def convert_jsonl_to_json(jsonl_file: str) -> str:
+def convert_jsonl_to_json(
+    jsonl_file: str, messages: Optional[List[Dict[str, Any]]] = None
+) -> str:
     """Convert JSONL file to JSON array file.
 
     Creates a .json file with the same name as the .jsonl file,
     containing all messages as a JSON array.
 
+    Args:
+        jsonl_file: Path to the JSONL output file
+        messages: Already-parsed messages, to avoid reading the file again
+
     Returns:
         Path to the created JSON file
     """
     # Create JSON filename by replacing .jsonl with .json
     json_file = jsonl_file.replace(".jsonl", ".json")
 
-    # Parse the JSONL file
-    messages, _ = parse_jsonl_output(jsonl_file)
+    # Parse the JSONL file unless the caller already did
+    if messages is None:
+        messages, _ = parse_jsonl_output(jsonl_file)
 
     # Write as JSON array
     with open(json_file, "w") as f:
@@ -386,7 +393,7 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
             messages, result_message = parse_jsonl_output(request.output_file)
 
             # Convert JSONL to JSON array file
-            json_file = convert_jsonl_to_json(request.output_file)
+            json_file = convert_jsonl_to_json(request.output_file, messages)
 
             if result_message:
                 # Extract session_id from result message
@@ -240,38 +240,52 @@ def validate_cdk_app(
         return False, output
 
 
-def get_stack_status(
-    stack_name: str,
+def get_all_stack_statuses(
     cdk_app_dir: str,
     logger: logging.Logger
-) -> Optional[str]:
-    """Get the current status of a CDK stack.
+) -> Dict[str, str]:
+    """Get the status of every stack in a CDK app with one `cdk list` call.
 
     Args:
-        stack_name: Name of the stack
         cdk_app_dir: Directory containing the CDK app
         logger: Logger instance
 
     Returns:
-        Stack status string or None if not found
+        Mapping of stack name to status; empty if the listing failed
     """
     cmd = ["cdk", "list", "--json"]
     success, output = run_cdk_command(cmd, cdk_app_dir, logger)
 
     if not success:
-        return None
+        return {}
 
     try:
         stacks = json.loads(output)
+    except json.JSONDecodeError:
+        return {}
 
-        for stack in stacks:
-            if stack.get("name") == stack_name:
-                return stack.get("status", "unknown")
+    return {stack.get("name"): stack.get("status", "unknown") for stack in stacks}
 
-        return None
 
-    except json.JSONDecodeError:
-        return None
+def get_stack_status(
+    stack_name: str,
+    cdk_app_dir: str,
+    logger: logging.Logger
+) -> Optional[str]:
+    """Get the current status of a CDK stack.
+
+    Lists the whole app; use get_all_stack_statuses() when checking several
+    stacks.
+
+    Args:
+        stack_name: Name of the stack
+        cdk_app_dir: Directory containing the CDK app
+        logger: Logger instance
+
+    Returns:
+        Stack status string or None if not found
+    """
+    return get_all_stack_statuses(cdk_app_dir, logger).get(stack_name)
 
 
 def bootstrap_cdk_environment(
@@ -11,6 +11,12 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+
 
 def generate_cdk_config_yaml(
     client_name: str,
@@ -75,7 +81,7 @@ def generate_cdk_config_yaml(
     config_path = os.path.join(output_dir, "cdk_config.yaml")
 
     with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False)
 
     logger.info(f"CDK config written to {config_path}")
     return config_path
@@ -20,6 +20,12 @@ from typing import Dict, Any, Optional, List, Tuple
 import json
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 class ConfigManager:
     """
@@ -99,7 +105,7 @@ class ConfigManager:
         config_file = self.config_dir / "config.yaml"
         if config_file.exists():
             with open(config_file, "r") as f:
-                project_config = yaml.safe_load(f)
+                project_config = yaml.load(f, Loader=YamlSafeLoader)
                 if project_config:
                     config.update(project_config)
                     self.logger.debug(f"Loaded config.yaml: {config_file}")
@@ -108,7 +114,7 @@ class ConfigManager:
         env_config_file = self.config_dir / f"config.{self.environment}.yaml"
         if env_config_file.exists():
             with open(env_config_file, "r") as f:
-                env_config = yaml.safe_load(f)
+                env_config = yaml.load(f, Loader=YamlSafeLoader)
                 if env_config:
                     config.update(env_config)
                     self.logger.debug(f"Loaded {self.environment} config: {env_config_file}")
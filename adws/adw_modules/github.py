@@ -17,12 +17,20 @@ import subprocess
 import sys
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 from .data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
 
 # Bot identifier to prevent webhook loops and filter bot comments
 ADW_BOT_IDENTIFIER = "[ADW-AGENTS]"
 
+# GitHub rejects comment bodies longer than this many characters
+MAX_COMMENT_LENGTH = 65536
+
+# Appended to a single queued message that alone exceeds the limit
+COMMENT_TRUNCATION_NOTE = "\n\n... (truncated)"
+
 
 def get_github_env() -> Optional[dict]:
     """Get environment with GitHub token set up. Returns None if no GITHUB_PAT.
@@ -52,8 +60,13 @@ def get_github_env() -> Optional[dict]:
     return env
 
 
+@lru_cache(maxsize=None)
 def get_repo_url() -> str:
-    """Get GitHub repository URL from git remote."""
+    """Get GitHub repository URL from git remote.
+
+    The origin remote doesn't change during a run, so the git call is made
+    once per process; every comment post would otherwise spawn it again.
+    """
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
@@ -161,6 +174,126 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
         raise
 
 
+class CommentBatcher:
+    """Queue issue comments and post them as one coalesced comment.
+
+    Intermediate status updates are appended and only sent to GitHub when
+    flush() is called or the context exits, cutting one gh round-trip per
+    status update. Queued messages are split across several comments when
+    they would exceed GitHub's MAX_COMMENT_LENGTH. With no issue_id every
+    call is a no-op, so callers don't need to guard on an optional issue
+    number.
+
+    With background=True, flush() hands the post to a single worker thread
+    and returns at once, so the workflow doesn't wait on gh between steps.
+    Posts stay in order and the context exit waits for them to finish.
+
+    Example:
+        with CommentBatcher(issue_number) as comments:
+            comments.append(format_issue_message(adw_id, "ops", "✅ Started"))
+            comments.flush()  # Make the start visible immediately
+            comments.append(format_issue_message(adw_id, "ops", "📋 Found spec"))
+    """
+
+    def __init__(
+        self,
+        issue_id: Optional[str],
+        separator: str = "\n\n---\n\n",
+        background: bool = False,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            issue_id: GitHub issue number, or None to disable posting
+            separator: Text placed between queued messages in the posted comment
+            background: Post flushed comments from a worker thread
+        """
+        self.issue_id = issue_id
+        self.separator = separator
+        self._pending: List[str] = []
+        # One worker keeps the posts in order
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if background and issue_id:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="issue-comments")
+
+    def append(self, comment: str) -> None:
+        """Queue a comment for the next flush."""
+        if self.issue_id:
+            self._pending.append(comment)
+
+    def flush(self) -> None:
+        """Post all queued comments, coalesced into as few issue comments as fit."""
+        if not self.issue_id or not self._pending:
+            return
+
+        bodies = self._split_bodies()
+        self._pending = []
+        for body in bodies:
+            if self._executor:
+                self._executor.submit(self._post_in_background, body)
+            else:
+                make_issue_comment(self.issue_id, body)
+
+    def _split_bodies(self) -> List[str]:
+        """Join queued comments into bodies that each fit GitHub's size limit.
+
+        Messages are never split across bodies; one that is too long on its
+        own is truncated.
+        """
+        # Leave room for the bot identifier make_issue_comment prepends
+        limit = MAX_COMMENT_LENGTH - len(ADW_BOT_IDENTIFIER) - 1
+
+        bodies: List[str] = []
+        current: List[str] = []
+        size = 0
+        for comment in self._pending:
+            if len(comment) > limit:
+                comment = comment[:limit - len(COMMENT_TRUNCATION_NOTE)] + COMMENT_TRUNCATION_NOTE
+
+            added = len(comment) + (len(self.separator) if current else 0)
+            if current and size + added > limit:
+                bodies.append(self.separator.join(current))
+                current, size = [], 0
+                added = len(comment)
+
+            current.append(comment)
+            size += added
+
+        if current:
+            bodies.append(self.separator.join(current))
+        return bodies
+
+    def _post_in_background(self, body: str) -> None:
+        """Post a comment from the worker thread; errors are reported, not raised."""
+        try:
+            make_issue_comment(self.issue_id, body)
+        except Exception as e:
+            print(f"Error posting queued comments: {e}", file=sys.stderr)
+
+    def close(self) -> None:
+        """Wait for background posts to finish; later flushes post inline."""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "CommentBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                # Still surface queued status, but never mask the original error
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"Error flushing queued comments: {e}", file=sys.stderr)
+        finally:
+            self.close()
+        return False
+
+
 def mark_issue_in_progress(issue_id: str) -> None:
     """Mark issue as in progress by adding label and comment."""
     # Get repo information from git remote
@@ -0,0 +1,83 @@
+"""On-disk response cache for deterministic agent prompts.
+
+Re-running a phase for the same ADW ID with identical inputs should not
+re-bill the LLM. Responses are keyed by a SHA-256 of the prompt, model and
+agent name and stored in agents/{adw_id}/cache/{key}.json.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+def make_cache_key(prompt: str, model: str, agent_name: str) -> str:
+    """Build a stable cache key for a prompt request.
+
+    Args:
+        prompt: Full prompt text sent to the agent
+        model: Model name (e.g., "sonnet")
+        agent_name: Agent name used for the request
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = json.dumps(
+        {"prompt": prompt, "model": model, "agent": agent_name}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cache_dir(adw_id: str) -> Path:
+    """Get the response cache directory for a workflow.
+
+    Args:
+        adw_id: Workflow ID
+
+    Returns:
+        Path to agents/{adw_id}/cache
+    """
+    # __file__ is in adws/adw_modules/, go up 3 levels to get to project root
+    project_root = Path(__file__).parent.parent.parent
+    return project_root / "agents" / adw_id / "cache"
+
+
+def get_cached_response(adw_id: str, key: str) -> Optional[str]:
+    """Return a cached response output, or None on a miss.
+
+    Args:
+        adw_id: Workflow ID
+        key: Cache key from make_cache_key()
+
+    Returns:
+        Cached output string or None
+    """
+    cache_file = get_cache_dir(adw_id) / f"{key}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f).get("output")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def store_cached_response(adw_id: str, key: str, output: str) -> None:
+    """Store a successful response output in the cache.
+
+    Writes to a temporary file first so a crash never leaves a truncated
+    cache entry behind.
+
+    Args:
+        adw_id: Workflow ID
+        key: Cache key from make_cache_key()
+        output: Response output to cache
+    """
+    cache_dir = get_cache_dir(adw_id)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    cache_file = cache_dir / f"{key}.json"
+    tmp_file = cache_dir / f"{key}.json.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"output": output, "cached_at": datetime.now().isoformat()}, f)
+    os.replace(tmp_file, cache_file)
@@ -0,0 +1,122 @@
+"""Template bodies for the template-based scoping agent.
+
+The document templates live as plain files in adws/scoping_templates/, one
+per generated document and named after it. They are written as the final
+document text, with the __ADW_ID__ placeholder wherever the workflow ID
+belongs; there is no other templating syntax, so braces are literal. Each
+is read the first time it is needed and pre-split into UTF-8 encoded
+chunks around the placeholder so documents can be written without
+building the rendered string first.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Final, FrozenSet, List, Optional, Tuple
+
+# __file__ is in adws/adw_modules/, templates are in adws/scoping_templates/
+TEMPLATES_DIR: Final[Path] = Path(__file__).parent.parent / "scoping_templates"
+
+# Scoping documents to create, in order
+SCOPING_TEMPLATE_NAMES: Final[Tuple[str, ...]] = (
+    "2_ml_research.md",
+    "3_user_flows.yaml",
+    "4_data_models.yaml",
+    "5a_aws_native_analysis.md",
+    "5_aws_services.yaml",
+    "6_architecture.mmd",
+    "7_cost_estimate.md",
+    "8_data_schema.mmd",
+    "9_user_auth_rbac.md",
+    "10_cdk_constructs.md",
+    "11_validation_gates.yaml",
+    "12_llm_prompts.yaml",
+)
+
+
+# Placeholder substituted with the workflow ID
+ADW_ID_PLACEHOLDER: Final[str] = "__ADW_ID__"
+
+
+@lru_cache(maxsize=None)
+def load_template(name: str) -> str:
+    """Read a template body exactly as stored (no newline translation).
+
+    Bodies are read on first use and cached, so importing this module costs
+    no file I/O.
+
+    Args:
+        name: Template filename from SCOPING_TEMPLATE_NAMES
+
+    Returns:
+        Template text containing ADW_ID_PLACEHOLDER
+    """
+    with open(TEMPLATES_DIR / name, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def compile_segments(template: str) -> Tuple[bytes, ...]:
+    """Split a template into encoded literal chunks around its placeholders.
+
+    Args:
+        template: Template text containing ADW_ID_PLACEHOLDER
+
+    Returns:
+        Literal chunks; the ADW ID belongs between each adjacent pair
+    """
+    return tuple(part.encode("utf-8") for part in template.split(ADW_ID_PLACEHOLDER))
+
+
+@lru_cache(maxsize=None)
+def load_template_segments(name: str) -> Tuple[bytes, ...]:
+    """Get a template's encoded literal chunks, compiling them on first use.
+
+    Args:
+        name: Template filename from SCOPING_TEMPLATE_NAMES
+
+    Returns:
+        Literal chunks from compile_segments()
+    """
+    return compile_segments(load_template(name))
+
+
+def render_segments(chunks: Tuple[bytes, ...], adw_id: bytes) -> List[bytes]:
+    """Interleave a template's literal chunks with the encoded ADW ID.
+
+    Args:
+        chunks: Literal chunks from compile_segments()
+        adw_id: UTF-8 encoded workflow ID
+
+    Returns:
+        Byte segments that make up the rendered document, in order
+    """
+    segments = [chunks[0]]
+    for chunk in chunks[1:]:
+        segments.append(adw_id)
+        segments.append(chunk)
+    return segments
+
+
+@lru_cache(maxsize=32)
+def render_scoping_segments(
+    adw_id: str,
+    only: Optional[FrozenSet[str]] = None
+) -> Tuple[Tuple[str, Tuple[bytes, ...]], ...]:
+    """Render scoping documents for an ADW ID as byte segments.
+
+    Cached per ADW ID, since pipelines re-run scoping for the same workflow.
+    Entries only reference the shared literal chunks, so they are cheap to keep.
+
+    Args:
+        adw_id: Workflow ID
+        only: Template filenames to render, or None for all of them. Templates
+            outside the selection are never loaded.
+
+    Returns:
+        (filename, segments) pairs, in SCOPING_TEMPLATE_NAMES order
+    """
+    adw_id_bytes = adw_id.encode("utf-8")
+    return tuple(
+        (name, tuple(render_segments(load_template_segments(name), adw_id_bytes)))
+        for name in SCOPING_TEMPLATE_NAMES
+        if only is None or name in only
+    )
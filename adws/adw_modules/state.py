@@ -6,9 +6,10 @@ Provides persistent state across all phases of the workflow with AWS infrastruct
 import json
 import os
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 from .data_types import (
     ADWStateData,
     InfrastructureConfig,
@@ -48,6 +49,10 @@ class ADWState:
         # Extended phase-specific data (for software-delivery-adw phases)
         self._extended_data: Dict[str, Any] = {}
 
+        # Nesting depth of batch() blocks; saves are deferred while > 0
+        self._batch_depth = 0
+        self._save_pending = False
+
         # Load existing state if available
         if self.state_file.exists():
             self._load_from_disk()
@@ -129,24 +134,93 @@ class ADWState:
         self._extended_data["current_phase"] = phase
         self._extended_data["updated_at"] = datetime.now().isoformat()
 
+    def update_phase_fields(self, phase: str, fields: Dict[str, Any]) -> None:
+        """Merge a mapping into a specific phase's data.
+
+        Like update_phase(), but takes the mapping directly so callers with
+        many (possibly non-identifier) keys don't have to expand it as kwargs.
+
+        Args:
+            phase: Phase name (discovery, scoping, planning, etc.)
+            fields: Key-value pairs to merge into that phase
+        """
+        self._extended_data.setdefault(phase, {}).update(fields)
+        self._extended_data["current_phase"] = phase
+        self._extended_data["updated_at"] = datetime.now().isoformat()
+
+    def _dump_core(self) -> Dict[str, Any]:
+        """Serialize core data.
+
+        Dumped fresh on every call: get() and get_infrastructure_config()
+        hand out the live model objects, so callers can mutate core data
+        without going through a setter and a cached dump would go stale.
+
+        Returns:
+            JSON-compatible dictionary of core data
+        """
+        return self._core_data.model_dump(mode="json", exclude_none=True)
+
     def save(self, source: str = "unknown") -> None:
         """Save state to disk.
 
+        The file is written to a temporary path, fsynced and moved into place,
+        so a crash never leaves a partially written state file. Inside a
+        batch() block the write is deferred until the block exits.
+
         Args:
             source: Source of the save operation for logging
         """
+        if self._batch_depth:
+            self._save_pending = True
+            return
+
         # Combine core and extended data for saving
         save_data = {
-            **self._core_data.model_dump(mode="json", exclude_none=True),
+            **self._dump_core(),
             **self._extended_data
         }
 
-        with open(self.state_file, 'w') as f:
-            json.dump(save_data, f, indent=2, default=str)
+        # Encode in one pass and hand the file a single write; json.dump
+        # would issue a write call per encoded fragment
+        payload = json.dumps(save_data, indent=2, default=str)
+
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+
+        self._save_pending = False
 
         if self.logger:
             self.logger.debug(f"State saved by {source}")
 
+    @contextmanager
+    def batch(self, source: str = "batch") -> Iterator["ADWState"]:
+        """Defer all saves until the block exits, then write once.
+
+        State is always written on exit, including when the block raises,
+        so progress made before a failure is kept. Blocks may be nested;
+        only the outermost one writes.
+
+        Args:
+            source: Source of the save operation for logging
+
+        Example:
+            with state.batch():
+                state.update_phase("scoping", started=True)
+                ...
+                state.update_phase("scoping", completed=True)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.save(source)
+
     def _load_from_disk(self) -> None:
         """Load state from disk."""
         if self.state_file.exists():
@@ -279,7 +353,7 @@ class ADWState:
             Complete state dictionary
         """
         return {
-            **self._core_data.model_dump(mode="json", exclude_none=True),
+            **self._dump_core(),
             **self._extended_data
         }
 
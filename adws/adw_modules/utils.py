@@ -7,10 +7,33 @@ import re
 import sys
 import uuid
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, TypeVar, Type, Union, Dict, Optional
 
 T = TypeVar('T')
 
+# Markdown code block around agent JSON: ```json\n...\n``` or ```\n...\n```
+CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+
+# Set once load_env_once() has loaded .env in this process
+_ENV_LOADED = False
+
+
+def load_env_once() -> None:
+    """Load .env into the environment at most once per process.
+
+    Phases imported into a long-running orchestrator would otherwise re-read
+    and re-parse .env on every main() call.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _ENV_LOADED = True
+
 
 def make_adw_id() -> str:
     """Generate a short 8-character UUID for ADW tracking."""
@@ -85,6 +108,18 @@ def get_logger(adw_id: str) -> logging.Logger:
     return logging.getLogger(f"adw_{adw_id}")
 
 
+@lru_cache(maxsize=64)
+def _get_adapter(target_type: Any) -> Any:
+    """Build the pydantic TypeAdapter for a target type once and reuse it.
+
+    Adapter construction costs far more than validating a small payload, and
+    parse_json is called with the same few types on every agent response.
+    """
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(target_type)
+
+
 def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
     """Parse JSON that may be wrapped in markdown code blocks.
 
@@ -102,18 +137,16 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
         Parsed JSON object, optionally validated as target_type
 
     Raises:
-        ValueError: If JSON cannot be parsed from the text
+        ValueError: If JSON cannot be parsed from the text or does not
+            validate as target_type (pydantic's ValidationError)
     """
-    # Try to extract JSON from markdown code blocks
-    # Pattern matches ```json\n...\n``` or ```\n...\n```
-    code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    json_str = text.strip()
 
-    if match:
-        json_str = match.group(1).strip()
-    else:
-        # No code block found, try to parse the entire text
-        json_str = text.strip()
+    # Raw JSON needs no extraction; otherwise look for a markdown code block
+    if not json_str.startswith(('[', '{')):
+        match = CODE_BLOCK_PATTERN.search(json_str)
+        if match:
+            json_str = match.group(1).strip()
 
     # Try to find JSON array or object boundaries if not already clean
     if not (json_str.startswith('[') or json_str.startswith('{')):
@@ -134,30 +167,31 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
                 json_str = json_str[obj_start:obj_end + 1]
 
     try:
-        result = json.loads(json_str)
-
-        # If target_type is provided and has from_dict/parse_obj/model_validate methods (Pydantic)
-        if target_type and hasattr(target_type, '__origin__'):
-            # Handle List[SomeType] case
-            if target_type.__origin__ == list:
-                item_type = target_type.__args__[0]
-                # Try Pydantic v2 first, then v1
-                if hasattr(item_type, 'model_validate'):
-                    result = [item_type.model_validate(item) for item in result]
-                elif hasattr(item_type, 'parse_obj'):
-                    result = [item_type.parse_obj(item) for item in result]
-        elif target_type:
-            # Handle single Pydantic model
-            if hasattr(target_type, 'model_validate'):
-                result = target_type.model_validate(result)
-            elif hasattr(target_type, 'parse_obj'):
-                result = target_type.parse_obj(result)
-
-        return result
+        # Parse and validate in one pass so no intermediate dicts are built
+        if target_type:
+            return _get_adapter(target_type).validate_json(json_str)
+
+        return json.loads(json_str)
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON: {e}. Text was: {json_str[:200]}...")
 
 
+def write_file_atomic(file_path: Union[str, Path], content: str) -> None:
+    """Write content to a temp file and atomically move it over file_path.
+
+    A crash mid-write never leaves a truncated file behind, so a rerun can
+    trust whatever is already on disk.
+
+    Args:
+        file_path: Destination file
+        content: Text to write (UTF-8)
+    """
+    tmp_path = Path(f"{file_path}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        f.write(content)
+    os.replace(tmp_path, file_path)
+
+
 def check_env_vars(logger: Optional[logging.Logger] = None) -> None:
     """Check that all required environment variables are set.
 
@@ -576,6 +576,8 @@ def find_spec_file(state: ADWState, logger: logging.Logger) -> Optional[str]:
     """Find the spec file from state or by examining git diff.
 
     For isolated workflows, automatically uses worktree_path from state.
+    A spec file found by searching is remembered in state as "spec_file"
+    so later lookups (e.g. review retries) skip the git diff and glob.
     """
     # Get worktree path if in isolated workflow
     worktree_path = state.get("worktree_path")
@@ -591,6 +593,12 @@ def find_spec_file(state: ADWState, logger: logging.Logger) -> Optional[str]:
             logger.info(f"Using spec file from state: {spec_file}")
             return spec_file
 
+    # Reuse a previously discovered spec file if it is still on disk
+    cached_spec_file = state.get("spec_file")
+    if cached_spec_file and os.path.isfile(cached_spec_file):
+        logger.info(f"Using cached spec file: {cached_spec_file}")
+        return cached_spec_file
+
     # Otherwise, try to find it from git diff
     logger.info("Looking for spec file in git diff")
     result = subprocess.run(
@@ -610,6 +618,7 @@ def find_spec_file(state: ADWState, logger: logging.Logger) -> Optional[str]:
             if worktree_path:
                 spec_file = os.path.join(worktree_path, spec_file)
             logger.info(f"Found spec file: {spec_file}")
+            state.update(spec_file=spec_file)
             return spec_file
 
     # If still not found, try to derive from branch name
@@ -636,6 +645,7 @@ def find_spec_file(state: ADWState, logger: logging.Logger) -> Optional[str]:
             if spec_files:
                 spec_file = spec_files[0]
                 logger.info(f"Found spec file by pattern: {spec_file}")
+                state.update(spec_file=spec_file)
                 return spec_file
 
     logger.warning("No spec file found")
@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run
 # /// script
-# dependencies = ["python-dotenv", "pydantic"]
+# dependencies = ["python-dotenv", "pydantic>=2"]
 # ///
 
 """ADW Review - AI Developer Workflow for agentic code review in isolated worktrees.
@@ -26,12 +26,16 @@ import argparse
 import sys
 import logging
 import json
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict
 from pathlib import Path
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports when run as a script; importing
+# this module as part of the adws package leaves sys.path untouched
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from adws.adw_modules.state import ADWState
 from adws.adw_modules.git_ops import commit_changes, finalize_git_operations
@@ -40,6 +44,7 @@ from adws.adw_modules.github import (
     make_issue_comment,
     get_repo_url,
     extract_repo_path,
+    CommentBatcher,
 )
 from adws.adw_modules.workflow_ops import (
     create_commit,
@@ -64,6 +69,16 @@ AGENT_REVIEW_PATCH_PLANNER = "review_patch_planner"
 # Maximum number of review retry attempts after resolution
 MAX_REVIEW_RETRY_ATTEMPTS = 3
 
+# Maximum number of blocker patch plans created concurrently
+MAX_CONCURRENT_PATCH_PLANS = 4
+
+# Severity buckets rendered in the review summary, in display order
+SEVERITY_SECTIONS = [
+    ("blocker", "🚨 Blockers"),
+    ("tech_debt", "⚠️ Tech Debt"),
+    ("skippable", "💡 Skippable"),
+]
+
 
 def run_review(
     spec_file: str,
@@ -80,9 +95,12 @@ def run_review(
         working_dir=working_dir,
     )
 
-    logger.debug(f"review_request: {request.model_dump_json(indent=2, by_alias=True)}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("review_request: %s", request.model_dump_json(indent=2, by_alias=True))
     response = execute_template(request)
-    logger.debug(f"review_response: {response.model_dump_json(indent=2, by_alias=True)}")
+    if debug_enabled:
+        logger.debug("review_response: %s", response.model_dump_json(indent=2, by_alias=True))
 
     if not response.success:
         logger.error(f"Review failed: {response.output}")
@@ -94,10 +112,15 @@ def run_review(
             screenshot_urls=[],
         )
 
-    # Parse the review result
+    # Parse the review result - single-pass parse+validate on the common
+    # bare/fenced JSON output, falling back to parse_json's boundary scan
     try:
-        result = parse_json(response.output, ReviewResult)
-        return result
+        json_text = response.output.strip()
+        json_text = json_text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+        try:
+            return ReviewResult.model_validate_json(json_text)
+        except ValidationError:
+            return parse_json(response.output, ReviewResult)
     except Exception as e:
         logger.error(f"Error parsing review result: {e}")
         return ReviewResult(
@@ -124,8 +147,9 @@ def create_review_patch_plan(
         f"Severity: {issue.issue_severity}",
     ]
 
+    # Per-issue agent name keeps concurrent planners from sharing an output file
     request = AgentTemplateRequest(
-        agent_name=AGENT_REVIEW_PATCH_PLANNER,
+        agent_name=f"{AGENT_REVIEW_PATCH_PLANNER}_{issue_num}",
         slash_command="/patch",
         args=patch_args,
         adw_id=adw_id,
@@ -140,7 +164,8 @@ def resolve_blocker_issues(
     issue_number: Optional[str],
     adw_id: str,
     worktree_path: str,
-    logger: logging.Logger
+    logger: logging.Logger,
+    comments: Optional[CommentBatcher] = None,
 ) -> None:
     """Resolve blocker issues by creating and implementing patches.
 
@@ -150,48 +175,98 @@ def resolve_blocker_issues(
         adw_id: ADW workflow ID
         worktree_path: Path to the worktree
         logger: Logger instance
+        comments: Optional batcher to queue status comments on instead of posting
     """
     logger.info(f"Found {len(blocker_issues)} blocker issues, attempting resolution")
-    if issue_number:
-        make_issue_comment(
-            issue_number,
-            format_issue_message(
-                adw_id,
-                AGENT_REVIEW_PATCH_PLANNER,
-                f"🔧 Found {len(blocker_issues)} blocker issues, creating resolution plans..."
-            )
-        )
+    message = format_issue_message(
+        adw_id,
+        AGENT_REVIEW_PATCH_PLANNER,
+        f"🔧 Found {len(blocker_issues)} blocker issues, creating resolution plans..."
+    )
+    if comments is not None:
+        comments.append(message)
+    elif issue_number:
+        make_issue_comment(issue_number, message)
+
+    # Patch plans are independent LLM calls, so create them concurrently
+    max_workers = min(MAX_CONCURRENT_PATCH_PLANS, len(blocker_issues))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        plan_futures = [
+            executor.submit(create_review_patch_plan, issue, i, adw_id, logger, working_dir=worktree_path)
+            for i, issue in enumerate(blocker_issues, 1)
+        ]
+
+        # Implement serially in blocker order: implementors edit the same worktree
+        for i, (issue, future) in enumerate(zip(blocker_issues, plan_futures), 1):
+            logger.info(f"Resolving blocker {i}/{len(blocker_issues)}: {issue.issue_description}")
 
-    # Create and implement patches for each blocker
-    for i, issue in enumerate(blocker_issues, 1):
-        logger.info(f"Resolving blocker {i}/{len(blocker_issues)}: {issue.issue_description}")
+            try:
+                plan_response = future.result()
+            except Exception as e:
+                logger.error(f"Failed to create patch plan: {e}")
+                continue
 
-        # Create patch plan
-        plan_response = create_review_patch_plan(issue, i, adw_id, logger, working_dir=worktree_path)
+            if not plan_response.success:
+                logger.error(f"Failed to create patch plan: {plan_response.output}")
+                continue
 
-        if not plan_response.success:
-            logger.error(f"Failed to create patch plan: {plan_response.output}")
-            continue
+            # Extract plan file path
+            plan_file = plan_response.output.strip()
 
-        # Extract plan file path
-        plan_file = plan_response.output.strip()
+            # Implement the patch
+            logger.info(f"Implementing patch from plan: {plan_file}")
+            impl_response = implement_plan(plan_file, adw_id, logger, working_dir=worktree_path)
 
-        # Implement the patch
-        logger.info(f"Implementing patch from plan: {plan_file}")
-        impl_response = implement_plan(plan_file, adw_id, logger, working_dir=worktree_path)
+            if not impl_response.success:
+                logger.error(f"Failed to implement patch: {impl_response.output}")
+                continue
 
-        if not impl_response.success:
-            logger.error(f"Failed to implement patch: {impl_response.output}")
-            continue
+            logger.info(f"Successfully resolved blocker {i}")
 
-        logger.info(f"Successfully resolved blocker {i}")
 
+def _render_bucket(heading: str, issues: List[ReviewIssue], summary_parts: List[str]) -> None:
+    """Append one severity section of the review summary.
 
-def build_review_summary(review_result: ReviewResult) -> str:
+    Args:
+        heading: Section heading including emoji (e.g., "🚨 Blockers")
+        issues: Issues in this severity bucket
+        summary_parts: Summary lines to extend in place
+    """
+    if not issues:
+        return
+
+    summary_parts.append(f"\n### {heading} ({len(issues)})")
+    for issue in issues:
+        summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
+        summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
+        if issue.screenshot_path:
+            summary_parts.append(f"  - Screenshot: `{issue.screenshot_path}`")
+
+
+def group_issues_by_severity(review_issues: List[ReviewIssue]) -> Dict[str, List[ReviewIssue]]:
+    """Bucket review issues by severity in a single pass.
+
+    Args:
+        review_issues: Issues returned by the reviewer
+
+    Returns:
+        Dict mapping every severity in SEVERITY_SECTIONS to its issues
+    """
+    buckets = {severity: [] for severity, _ in SEVERITY_SECTIONS}
+    for issue in review_issues:
+        buckets[issue.issue_severity].append(issue)
+    return buckets
+
+
+def build_review_summary(
+    review_result: ReviewResult,
+    buckets: Optional[Dict[str, List[ReviewIssue]]] = None,
+) -> str:
     """Build a formatted summary of the review results for GitHub comment.
 
     Args:
         review_result: The review result containing summary, issues, and screenshots
+        buckets: Issues already grouped by group_issues_by_severity (computed if omitted)
 
     Returns:
         Formatted markdown string for GitHub comment
@@ -202,81 +277,50 @@ def build_review_summary(review_result: ReviewResult) -> str:
     if review_result.review_issues:
         summary_parts.append("\n## 🔍 Issues Found")
 
-        # Group by severity
-        blockers = [i for i in review_result.review_issues if i.issue_severity == "blocker"]
-        tech_debts = [i for i in review_result.review_issues if i.issue_severity == "tech_debt"]
-        skippables = [i for i in review_result.review_issues if i.issue_severity == "skippable"]
-
-        if blockers:
-            summary_parts.append(f"\n### 🚨 Blockers ({len(blockers)})")
-            for issue in blockers:
-                summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
-                summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
-                if issue.screenshot_path:
-                    summary_parts.append(f"  - Screenshot: `{issue.screenshot_path}`")
-
-        if tech_debts:
-            summary_parts.append(f"\n### ⚠️ Tech Debt ({len(tech_debts)})")
-            for issue in tech_debts:
-                summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
-                summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
-                if issue.screenshot_path:
-                    summary_parts.append(f"  - Screenshot: `{issue.screenshot_path}`")
-
-        if skippables:
-            summary_parts.append(f"\n### 💡 Skippable ({len(skippables)})")
-            for issue in skippables:
-                summary_parts.append(f"- **Issue {issue.review_issue_number}**: {issue.issue_description}")
-                summary_parts.append(f"  - Resolution: {issue.issue_resolution}")
-                if issue.screenshot_path:
-                    summary_parts.append(f"  - Screenshot: `{issue.screenshot_path}`")
+        if buckets is None:
+            buckets = group_issues_by_severity(review_result.review_issues)
+
+        for severity, heading in SEVERITY_SECTIONS:
+            _render_bucket(heading, buckets[severity], summary_parts)
 
     # Add screenshots section
     if review_result.screenshots:
         summary_parts.append(f"\n## 📸 Screenshots")
         summary_parts.append(f"Captured {len(review_result.screenshots)} screenshots\n")
-        for i, screenshot_path in enumerate(review_result.screenshots):
-            summary_parts.append(f"- Screenshot {i+1}: `{screenshot_path}`")
+        summary_parts.extend(
+            f"- Screenshot {i+1}: `{screenshot_path}`"
+            for i, screenshot_path in enumerate(review_result.screenshots)
+        )
 
     return "\n".join(summary_parts)
 
 
-def main():
-    """Main entry point."""
-    load_dotenv()
-
-    parser = argparse.ArgumentParser(description="ADW Review - Automated code review workflow")
-    parser.add_argument("--adw-id", required=True, help="Workflow ID")
-    parser.add_argument("--issue-number", help="GitHub issue number (optional)")
-    parser.add_argument("--skip-resolution", action="store_true", help="Skip automatic blocker resolution")
-    args = parser.parse_args()
-
-    adw_id = args.adw_id
-    issue_number = args.issue_number
-    skip_resolution = args.skip_resolution
-
-    # Load state
-    logger = setup_logger(adw_id, "adw_review")
-    state = ADWState.load(adw_id, logger)
-
-    if not state:
-        logger.error(f"No state found for ADW ID: {adw_id}")
-        print(f"Error: No state found for ADW ID: {adw_id}")
-        print("Run adw_planning.py first to create the worktree and state")
-        sys.exit(1)
-
-    logger.info(f"ADW Review starting - ID: {adw_id}, Issue: {issue_number}, Skip Resolution: {skip_resolution}")
+def run_review_phase(
+    state: ADWState,
+    adw_id: str,
+    issue_number: Optional[str],
+    skip_resolution: bool,
+    logger: logging.Logger,
+    comments: CommentBatcher,
+) -> None:
+    """Run the review, blocker resolution and commit steps for a loaded state.
 
+    Args:
+        state: Loaded ADW state
+        adw_id: ADW workflow ID
+        issue_number: GitHub issue number (optional)
+        skip_resolution: Skip automatic blocker resolution
+        logger: Logger instance
+        comments: Batcher that coalesces issue status comments
+    """
     # Validate worktree exists
     valid, error = validate_worktree(adw_id, state)
     if not valid:
         logger.error(f"Worktree validation failed: {error}")
         print(f"Error: Worktree validation failed: {error}")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(adw_id, "ops", f"❌ Worktree validation failed: {error}\nRun adw_planning.py first")
-            )
+        comments.append(
+            format_issue_message(adw_id, "ops", f"❌ Worktree validation failed: {error}\nRun adw_planning.py first")
+        )
         sys.exit(1)
 
     worktree_path = state.get("worktree_path")
@@ -285,18 +329,17 @@ def main():
     backend_port = state.get("backend_port", "9100")
     frontend_port = state.get("frontend_port", "9200")
 
-    if issue_number:
-        make_issue_comment(
-            issue_number,
-            format_issue_message(
-                adw_id,
-                "ops",
-                f"✅ Starting isolated review phase\n"
-                f"🏠 Worktree: {worktree_path}\n"
-                f"🔌 Ports - Backend: {backend_port}, Frontend: {frontend_port}\n"
-                f"🔧 Issue Resolution: {'Disabled' if skip_resolution else 'Enabled'}"
-            )
+    comments.append(
+        format_issue_message(
+            adw_id,
+            "ops",
+            f"✅ Starting isolated review phase\n"
+            f"🏠 Worktree: {worktree_path}\n"
+            f"🔌 Ports - Backend: {backend_port}, Frontend: {frontend_port}\n"
+            f"🔧 Issue Resolution: {'Disabled' if skip_resolution else 'Enabled'}"
         )
+    )
+    comments.flush()
 
     # Find spec file from current branch (in worktree)
     logger.info("Looking for spec file in worktree")
@@ -306,47 +349,42 @@ def main():
         error_msg = "Could not find spec file for review"
         logger.error(error_msg)
         print(f"Error: {error_msg}")
-        if issue_number:
-            make_issue_comment(issue_number, format_issue_message(adw_id, "ops", f"❌ {error_msg}"))
+        comments.append(format_issue_message(adw_id, "ops", f"❌ {error_msg}"))
         sys.exit(1)
 
     logger.info(f"Found spec file: {spec_file}")
-    if issue_number:
-        make_issue_comment(issue_number, format_issue_message(adw_id, "ops", f"📋 Found spec file: {spec_file}"))
+    comments.append(format_issue_message(adw_id, "ops", f"📋 Found spec file: {spec_file}"))
 
     # Run review with retry logic
     review_attempt = 0
     review_result = None
+    severity_buckets = {}
 
     while review_attempt < MAX_REVIEW_RETRY_ATTEMPTS:
         review_attempt += 1
 
         # Run the review (executing in worktree)
         logger.info(f"Running review (attempt {review_attempt}/{MAX_REVIEW_RETRY_ATTEMPTS})")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(
-                    adw_id,
-                    AGENT_REVIEWER,
-                    f"🔍 Reviewing implementation against spec (attempt {review_attempt}/{MAX_REVIEW_RETRY_ATTEMPTS})..."
-                )
+        comments.append(
+            format_issue_message(
+                adw_id,
+                AGENT_REVIEWER,
+                f"🔍 Reviewing implementation against spec (attempt {review_attempt}/{MAX_REVIEW_RETRY_ATTEMPTS})..."
             )
+        )
 
         review_result = run_review(spec_file, adw_id, logger, working_dir=worktree_path)
 
-        # Check if we have blocker issues
-        blocker_issues = [
-            issue for issue in review_result.review_issues
-            if issue.issue_severity == "blocker"
-        ]
+        # Group issues once per review; reused for the summary, state counts and exit code
+        severity_buckets = group_issues_by_severity(review_result.review_issues)
+        blocker_issues = severity_buckets["blocker"]
 
         # If no blockers or skip resolution, we're done
         if not blocker_issues or skip_resolution:
             break
 
         # We have blockers and need to resolve them
-        resolve_blocker_issues(blocker_issues, issue_number, adw_id, worktree_path, logger)
+        resolve_blocker_issues(blocker_issues, issue_number, adw_id, worktree_path, logger, comments)
 
         # If this was the last attempt, break regardless
         if review_attempt >= MAX_REVIEW_RETRY_ATTEMPTS - 1:
@@ -354,26 +392,26 @@ def main():
 
         # Otherwise, we'll retry the review
         logger.info("Retrying review after resolving blockers")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(adw_id, AGENT_REVIEWER, "🔄 Retrying review after resolving blockers...")
-            )
+        comments.append(
+            format_issue_message(adw_id, AGENT_REVIEWER, "🔄 Retrying review after resolving blockers...")
+        )
+
+    blocker_count = len(severity_buckets["blocker"]) if review_result else 0
 
     # Post review results
     if review_result:
-        # Build and post the summary comment
-        summary = build_review_summary(review_result)
-        if issue_number:
-            make_issue_comment(issue_number, format_issue_message(adw_id, AGENT_REVIEWER, summary))
+        # Build and post the summary comment together with queued status
+        summary = build_review_summary(review_result, severity_buckets)
+        comments.append(format_issue_message(adw_id, AGENT_REVIEWER, summary))
+        comments.flush()
 
         # Save review results to state
         state.update_phase(
             "review",
             completed=review_result.success,
-            blocker_count=sum(1 for i in review_result.review_issues if i.issue_severity == "blocker"),
-            tech_debt_count=sum(1 for i in review_result.review_issues if i.issue_severity == "tech_debt"),
-            skippable_count=sum(1 for i in review_result.review_issues if i.issue_severity == "skippable")
+            blocker_count=blocker_count,
+            tech_debt_count=len(severity_buckets["tech_debt"]),
+            skippable_count=len(severity_buckets["skippable"])
         )
         state.save("adw_review")
 
@@ -393,8 +431,8 @@ def main():
 
             if error:
                 logger.error(f"Error creating commit message: {error}")
-                make_issue_comment(
-                    issue_number, format_issue_message(adw_id, AGENT_REVIEWER, f"❌ Error creating commit message: {error}")
+                comments.append(
+                    format_issue_message(adw_id, AGENT_REVIEWER, f"❌ Error creating commit message: {error}")
                 )
                 sys.exit(1)
 
@@ -403,37 +441,65 @@ def main():
 
             if not success:
                 logger.error(f"Error committing review: {error}")
-                make_issue_comment(
-                    issue_number, format_issue_message(adw_id, AGENT_REVIEWER, f"❌ Error committing review: {error}")
+                comments.append(
+                    format_issue_message(adw_id, AGENT_REVIEWER, f"❌ Error committing review: {error}")
                 )
                 sys.exit(1)
 
             logger.info(f"Committed review: {commit_msg}")
-            make_issue_comment(issue_number, format_issue_message(adw_id, AGENT_REVIEWER, "✅ Review committed"))
+            comments.append(format_issue_message(adw_id, AGENT_REVIEWER, "✅ Review committed"))
 
             # Finalize git operations (push and PR)
             finalize_git_operations(state, logger, cwd=worktree_path)
 
         except Exception as e:
             logger.error(f"Error in git operations: {e}")
-            make_issue_comment(issue_number, format_issue_message(adw_id, "ops", f"❌ Error in git operations: {e}"))
+            comments.append(format_issue_message(adw_id, "ops", f"❌ Error in git operations: {e}"))
 
     logger.info("Isolated review phase completed")
-    if issue_number:
-        make_issue_comment(issue_number, format_issue_message(adw_id, "ops", "✅ Isolated review phase completed"))
+    comments.append(format_issue_message(adw_id, "ops", "✅ Isolated review phase completed"))
 
     # Exit with appropriate code based on blockers
     if review_result:
-        blocker_count = sum(1 for i in review_result.review_issues if i.issue_severity == "blocker")
         if blocker_count > 0:
             logger.error(f"Review completed with {blocker_count} unresolved blockers")
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, "ops", f"❌ Review completed with {blocker_count} unresolved blockers")
-                )
+            comments.append(
+                format_issue_message(adw_id, "ops", f"❌ Review completed with {blocker_count} unresolved blockers")
+            )
             sys.exit(1)
 
 
+def main():
+    """Main entry point."""
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="ADW Review - Automated code review workflow")
+    parser.add_argument("--adw-id", required=True, help="Workflow ID")
+    parser.add_argument("--issue-number", help="GitHub issue number (optional)")
+    parser.add_argument("--skip-resolution", action="store_true", help="Skip automatic blocker resolution")
+    args = parser.parse_args()
+
+    adw_id = args.adw_id
+    issue_number = args.issue_number
+    skip_resolution = args.skip_resolution
+
+    # Load state
+    logger = setup_logger(adw_id, "adw_review")
+    state = ADWState.load(adw_id, logger)
+
+    if not state:
+        logger.error(f"No state found for ADW ID: {adw_id}")
+        print(f"Error: No state found for ADW ID: {adw_id}")
+        print("Run adw_planning.py first to create the worktree and state")
+        sys.exit(1)
+
+    logger.info(f"ADW Review starting - ID: {adw_id}, Issue: {issue_number}, Skip Resolution: {skip_resolution}")
+
+    # Status updates are queued and posted as coalesced comments; only the
+    # start and final result are flushed eagerly
+    with CommentBatcher(issue_number) as comments:
+        run_review_phase(state, adw_id, issue_number, skip_resolution, logger, comments)
+
+
 if __name__ == "__main__":
     main()
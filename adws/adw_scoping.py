@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run
 # /// script
-# dependencies = ["python-dotenv", "pyyaml"]
+# dependencies = ["python-dotenv", "pyyaml", "pydantic>=2"]
 # ///
 
 """Scoping Agent - AI-powered sequential reasoning for technical architecture.
@@ -9,83 +9,122 @@ This script generates comprehensive scoping documentation using Claude Code
 to reason through each aspect sequentially, building context as it progresses.
 
 Usage:
-    uv run adw_scoping.py --adw-id abc123 [--context "additional info"]
+    uv run adw_scoping.py --adw-id abc123 [--context "additional info"] [--no-cache] [--resume-from N]
 """
 
 import argparse
+import json
+import os
 import sys
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# Add parent directory to path for imports when run as a script; importing
+# this module as part of the adws package leaves sys.path untouched
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from adws.adw_modules.state import ADWState
 from adws.adw_modules.agent import AgentPromptRequest, prompt_claude_code_with_retry
-from adws.adw_modules.cdk_generator import (
-    generate_cdk_config_yaml,
-    generate_cdk_construct_template,
-    generate_parameter_store_script
+from adws.adw_modules.llm_cache import (
+    make_cache_key,
+    get_cached_response,
+    store_cached_response
 )
-from adws.adw_modules.data_types import InfrastructureConfig
+from adws.adw_modules.utils import write_file_atomic
 
 
+@lru_cache(maxsize=1)
 def load_scoping_instructions():
-    """Load scoping file instructions from YAML config."""
+    """Load scoping file instructions from YAML config (parsed once per process).
+
+    The returned dict is shared between callers and must not be mutated.
+    """
     instructions_path = Path(__file__).parent / "scoping_instructions.yaml"
     with open(instructions_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlSafeLoader)
+
+
+# Linux-only flag that skips the access-time update on reads (0 elsewhere)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
 
 
 def read_file_safe(file_path):
-    """Read file content safely, return empty string if doesn't exist."""
+    """Read file content safely, return empty string if doesn't exist.
+
+    Opens with O_NOATIME where supported; the kernel only allows it for the
+    file's owner, so fall back to a plain open on EPERM.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        try:
+            fd = os.open(file_path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:
+            if not _O_NOATIME:
+                raise
+            fd = os.open(file_path, os.O_RDONLY)
     except FileNotFoundError:
         return ""
 
+    with open(fd, 'r', encoding='utf-8') as f:
+        return f.read()
 
-def generate_scoping_file(
-    file_config,
-    adw_id,
-    specs_dir,
-    accumulated_context,
-    agent_output_dir
-):
-    """
-    Generate a single scoping file using Claude Code agent.
+
+# Per-file context blocks persisted next to the spec files so --resume-from
+# can seed the context without re-reading every kept file
+ACCUMULATED_CONTEXT_FILENAME = "_accumulated_context.json"
+
+
+def context_block(file_config, file_content):
+    """Format a generated file as a block of the accumulated context."""
+    return f"\n\n# {file_config['title']} (File {file_config['number']})\n\n{file_content}"
+
+
+def save_persisted_context(context_path, blocks):
+    """Rewrite the persisted context blocks.
 
     Args:
-        file_config: File configuration from scoping_instructions.yaml
-        adw_id: Workflow ID
-        specs_dir: Path to specs directory
-        accumulated_context: Context from all previous files
-        agent_output_dir: Directory for agent output logs
+        context_path: Path to the persisted context file
+        blocks: Context blocks keyed by file number (as str), in context order
+    """
+    write_file_atomic(context_path, json.dumps(blocks))
+
+
+def load_persisted_context(context_path):
+    """Load the persisted context blocks.
 
     Returns:
-        tuple: (success: bool, file_content: str)
+        Context blocks keyed by file number (as str); empty if the file is
+        missing or unreadable
     """
-    file_num = file_config['number']
-    filename = file_config['filename']
-    title = file_config['title']
-    instructions = file_config['instructions']
+    try:
+        with open(context_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
-    print(f"\n>>> Generating File {file_num}: {filename}")
-    print(f"    {title}")
 
-    # Build prompt for Claude Code agent
-    prompt = f"""You are a technical architect conducting detailed scoping for a software project.
+# Static preamble shared by every scoping prompt. Together with the
+# accumulated context it forms a byte-identical prefix across all files in a
+# tier, which lets the model provider's prompt cache reuse it.
+SCOPING_PROMPT_PREAMBLE = """You are a technical architect conducting detailed scoping for a software project.
 
 # Context from Previous Analysis
 
-{accumulated_context}
+"""
 
----
 
-# Your Task
+# Per-file task appended after the context prefix; only the placeholders vary
+SCOPING_TASK_TEMPLATE = """# Your Task
 
 Generate the next scoping document: **{file_num}_{filename}**
 
@@ -103,6 +142,102 @@ Generate the next scoping document: **{file_num}_{filename}**
 Generate the complete {filename} file now:
 """
 
+
+def build_context_prefix(accumulated_context):
+    """Build the cacheable prompt prefix from the accumulated context.
+
+    Everything that varies per file (number, filename, instructions) must come
+    after this prefix so sibling files share the same leading bytes.
+
+    Args:
+        accumulated_context: Context from all previous files
+
+    Returns:
+        Prompt prefix string ending with the context separator
+    """
+    return f"{SCOPING_PROMPT_PREAMBLE}{accumulated_context}\n\n---\n\n"
+
+
+def build_dependency_tiers(files_config):
+    """Group file configs into tiers that can be generated concurrently.
+
+    Each file's `depends_on` list (from scoping_instructions.yaml) names the
+    file numbers it needs. File 1 (discovery brief) is always available.
+    Files without `depends_on` fall back to depending on the previous file,
+    preserving the original sequential ordering.
+
+    Args:
+        files_config: File configurations from scoping_instructions.yaml
+
+    Returns:
+        List of tiers, each a list of file configs sorted by file number
+
+    Raises:
+        ValueError: If the dependency graph contains a cycle or unknown file
+    """
+    by_num = {fc['number']: fc for fc in files_config}
+    ordered = sorted(by_num)
+
+    deps = {}
+    for i, num in enumerate(ordered):
+        declared = by_num[num].get('depends_on')
+        if declared is None:
+            declared = [ordered[i - 1]] if i > 0 else [1]
+        deps[num] = {d for d in declared if d != 1}
+
+    tiers = []
+    done = set()
+    remaining = set(ordered)
+    while remaining:
+        ready = sorted(n for n in remaining if deps[n] <= done)
+        if not ready:
+            raise ValueError(
+                f"Unresolvable scoping dependencies for files: {sorted(remaining)}"
+            )
+        tiers.append([by_num[n] for n in ready])
+        done.update(ready)
+        remaining.difference_update(ready)
+
+    return tiers
+
+
+def generate_scoping_file(
+    file_config,
+    adw_id,
+    specs_dir,
+    accumulated_context,
+    agent_output_dir,
+    use_cache=True
+):
+    """
+    Generate a single scoping file using Claude Code agent.
+
+    Args:
+        file_config: File configuration from scoping_instructions.yaml
+        adw_id: Workflow ID
+        specs_dir: Path to specs directory
+        accumulated_context: Context from all previous files
+        agent_output_dir: Directory for agent output logs
+        use_cache: Reuse a cached response for an identical prompt
+
+    Returns:
+        tuple: (success: bool, file_content: str)
+    """
+    file_num = file_config['number']
+    filename = file_config['filename']
+    title = file_config['title']
+    instructions = file_config['instructions']
+
+    print(f"\n>>> Generating File {file_num}: {filename}")
+    print(f"    {title}")
+
+    # Build prompt for Claude Code agent: stable prefix first, per-file task last
+    prompt = build_context_prefix(accumulated_context) + SCOPING_TASK_TEMPLATE.format(
+        file_num=file_num,
+        filename=filename,
+        instructions=instructions
+    )
+
     # Create output file path for agent logs
     output_file = agent_output_dir / f"file_{file_num}_{filename.replace('.', '_')}.jsonl"
 
@@ -117,67 +252,49 @@ Generate the complete {filename} file now:
         working_dir=str(Path.cwd())
     )
 
-    # Call Claude Code agent with retry logic
-    print(f"    Calling Claude Code agent...")
-    response = prompt_claude_code_with_retry(request, max_retries=2)
+    # Reuse a cached response when this exact prompt was answered before
+    cache_key = make_cache_key(prompt, request.model, request.agent_name)
+    cached_output = get_cached_response(adw_id, cache_key) if use_cache else None
 
-    if not response.success:
-        print(f"    [ERROR] Failed to generate {filename}")
-        print(f"    Error: {response.output}")
-        return False, ""
+    if cached_output is not None:
+        print(f"    [CACHE] Reusing cached response for {filename}")
+        file_content = cached_output.strip()
+    else:
+        # Call Claude Code agent with retry logic
+        print(f"    Calling Claude Code agent...")
+        response = prompt_claude_code_with_retry(request, max_retries=2)
+
+        if not response.success:
+            print(f"    [ERROR] Failed to generate {filename}")
+            print(f"    Error: {response.output}")
+            return False, ""
 
-    print(f"    [OK] Generated {filename}")
+        print(f"    [OK] Generated {filename}")
 
-    # Extract file content from response
-    file_content = response.output.strip()
+        # Extract file content from response
+        file_content = response.output.strip()
+        store_cached_response(adw_id, cache_key, response.output)
 
     # Write file to specs directory
     file_path = specs_dir / f"{file_num}_{filename}"
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(file_content)
+    write_file_atomic(file_path, file_content)
 
     return True, file_content
 
 
-def main():
-    """Main entry point for AI-powered scoping agent."""
-    load_dotenv()
-
-    # Set up logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-
-    parser = argparse.ArgumentParser(description="AI-Powered Scoping Agent")
-    parser.add_argument("--adw-id", required=True, help="Workflow ID")
-    parser.add_argument("--context", help="Additional context (transcripts, Miro boards, etc.)")
-    args = parser.parse_args()
-
-    print(f"\n{'='*80}")
-    print(f"AI-POWERED SCOPING PHASE")
-    print(f"{'='*80}\n")
-    print(f"ADW ID: {args.adw_id}")
-    print(f"Approach: Sequential Claude reasoning (14 files)")
-
-    # Load state
-    state = ADWState.load_from_id(args.adw_id)
-    if not state:
-        print(f"\n[ERROR] No state found for ADW ID: {args.adw_id}")
-        print("Run adw_discovery.py first!")
-        sys.exit(1)
-
-    # Check if discovery is complete
-    discovery_brief_path = state.get("discovery.discovery_brief")
-    if not discovery_brief_path:
-        print("\n[ERROR] Discovery phase not complete")
-        sys.exit(1)
-
-    print(f"Discovery brief: {discovery_brief_path}\n")
+def run_scoping(args, state: ADWState, discovery_brief_path: str, logger: logging.Logger) -> None:
+    """Generate all scoping files and CDK configurations for a workflow.
 
+    Args:
+        args: Parsed command-line arguments
+        state: Loaded workflow state
+        discovery_brief_path: Path to the discovery brief
+        logger: Logger for CDK generation
+    """
     # Update state
     state.update_phase("scoping", started=True)
     if args.context:
         state.update_phase("scoping", additional_context=args.context)
-    state.save()
 
     # Create output directories
     specs_dir = Path(f"specs/{args.adw_id}")
@@ -203,8 +320,10 @@ def main():
         print(f"[INFO] Found project file: {project_file}")
         print(f"[INFO] Including project context in scoping\n")
 
-    # Initialize accumulated context with discovery brief and project file
-    accumulated_context = f"""# Project Context
+    # Initialize accumulated context with discovery brief and project file.
+    # Kept as a list of parts and joined once per tier to avoid re-copying
+    # the whole context on every append.
+    context_header = f"""# Project Context
 
 {project_context if project_context else "No project file provided."}
 
@@ -213,37 +332,112 @@ def main():
 {discovery_brief}
 """
 
+    # Group files into dependency tiers (from depends_on in the YAML)
+    tiers = build_dependency_tiers(files_config)
+
+    # Files scheduled before --resume-from (in tier order) are kept as-is;
+    # it and every file scheduled after it are regenerated
+    schedule = [fc['number'] for tier in tiers for fc in tier]
+    resume_from = args.resume_from or 0
+    if resume_from and resume_from not in schedule:
+        print(f"[ERROR] --resume-from {resume_from} is not a scoping file number")
+        sys.exit(1)
+    kept_files = set(schedule[:schedule.index(resume_from)]) if resume_from else set()
+
+    # The context blocks are persisted per file so a failed run can resume;
+    # the file is rewritten with only the blocks this run's context contains
+    context_path = specs_dir / ACCUMULATED_CONTEXT_FILENAME
+    persisted_blocks = load_persisted_context(context_path) if kept_files else {}
+    if resume_from:
+        print(f"[INFO] Resuming from file {resume_from}, keeping files {sorted(kept_files)}\n")
+
+    context_parts = [context_header]
+    context_blocks = {}
+
     # Track generated files
     generated_files = {}
     successful_files = 0
     failed_files = 0
 
     print(f"{'='*80}")
-    print(f"SEQUENTIAL FILE GENERATION")
+    print(f"TIERED FILE GENERATION ({len(tiers)} tiers)")
     print(f"{'='*80}")
 
-    # Generate each scoping file sequentially
-    for file_config in files_config:
-        file_num = file_config['number']
-        filename = file_config['filename']
-
-        success, file_content = generate_scoping_file(
-            file_config=file_config,
-            adw_id=args.adw_id,
-            specs_dir=specs_dir,
-            accumulated_context=accumulated_context,
-            agent_output_dir=agent_output_dir
-        )
+    # Generate each tier concurrently; tiers run in dependency order
+    for tier in tiers:
+        # Files scheduled before --resume-from are taken from disk as-is
+        for file_config in tier:
+            file_num = file_config['number']
+            if file_num not in kept_files:
+                continue
+
+            filename = file_config['filename']
+            file_path = specs_dir / f"{file_num}_{filename}"
+            if not file_path.exists():
+                failed_files += 1
+                print(f"    [WARNING] {filename} missing, cannot resume past it")
+                continue
 
-        if success:
             successful_files += 1
-            generated_files[filename] = str(specs_dir / f"{file_num}_{filename}")
-
-            # Add this file's content to accumulated context for next file
-            accumulated_context += f"\n\n# {file_config['title']} (File {file_num})\n\n{file_content}"
-        else:
-            failed_files += 1
-            print(f"    [WARNING] Skipping {filename} due to generation error")
+            generated_files[filename] = str(file_path)
+            block = persisted_blocks.get(str(file_num))
+            if block is None:
+                block = context_block(file_config, read_file_safe(file_path))
+            context_blocks[str(file_num)] = block
+            context_parts.append(block)
+
+        tier = [fc for fc in tier if fc['number'] not in kept_files]
+        if not tier:
+            continue
+
+        tier_nums = [fc['number'] for fc in tier]
+        if len(tier) > 1:
+            print(f"\n>>> Generating files {tier_nums} in parallel")
+
+        accumulated_context = "".join(context_parts)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(tier)) as executor:
+            future_to_config = {
+                executor.submit(
+                    generate_scoping_file,
+                    file_config=file_config,
+                    adw_id=args.adw_id,
+                    specs_dir=specs_dir,
+                    accumulated_context=accumulated_context,
+                    agent_output_dir=agent_output_dir,
+                    use_cache=not args.no_cache
+                ): file_config
+                for file_config in tier
+            }
+
+            for future in as_completed(future_to_config):
+                file_config = future_to_config[future]
+                try:
+                    results[file_config['number']] = future.result()
+                except Exception as e:
+                    print(f"    [ERROR] {file_config['filename']}: {e}")
+                    results[file_config['number']] = (False, "")
+
+        # Extend context deterministically in file-number order
+        for file_config in tier:
+            file_num = file_config['number']
+            filename = file_config['filename']
+            success, file_content = results[file_num]
+
+            if success:
+                successful_files += 1
+                generated_files[filename] = str(specs_dir / f"{file_num}_{filename}")
+
+                # Add this file's content to accumulated context for next tier
+                block = context_block(file_config, file_content)
+                context_blocks[str(file_num)] = block
+                context_parts.append(block)
+            else:
+                failed_files += 1
+                print(f"    [WARNING] Skipping {filename} due to generation error")
+
+        save_persisted_context(context_path, context_blocks)
 
     print(f"\n{'='*80}")
     print(f"GENERATION COMPLETE")
@@ -252,13 +446,10 @@ def main():
     if failed_files > 0:
         print(f"Failed: {failed_files}/{len(files_config)}")
 
-    # Update state with generated files
-    state.update_phase(
-        "scoping",
-        completed=(failed_files == 0),
-        **{k.replace('.', '_'): v for k, v in generated_files.items()}
-    )
-    state.save()
+    # Update state with generated files (dots aren't valid in state keys)
+    phase_fields = {k.replace('.', '_'): v for k, v in generated_files.items()}
+    phase_fields["completed"] = (failed_files == 0)
+    state.update_phase_fields("scoping", phase_fields)
 
     # Generate CDK configurations (from existing adw_scoping.py logic)
     print(f"\n{'='*80}")
@@ -266,6 +457,14 @@ def main():
     print(f"{'='*80}\n")
 
     try:
+        # Only needed for this step, so importers of this module don't pay for it
+        from adws.adw_modules.cdk_generator import (
+            generate_cdk_config_yaml,
+            generate_cdk_construct_template,
+            generate_parameter_store_script
+        )
+        from adws.adw_modules.data_types import InfrastructureConfig
+
         aws_services_path = specs_dir / "8_aws_services.yaml"
         if not aws_services_path.exists():
             raise FileNotFoundError(f"AWS services file not found: {aws_services_path}")
@@ -319,7 +518,6 @@ def main():
             cdk_constructs=generated_constructs,
             param_script=str(param_script_path)
         )
-        state.save()
 
         print(f"\n[SUCCESS] CDK configurations generated!")
         print(f"CDK config directory: {cdk_config_dir}")
@@ -347,5 +545,45 @@ def main():
         print(f"Review agent logs in: {agent_output_dir}")
 
 
+def main():
+    """Main entry point for AI-powered scoping agent."""
+    load_dotenv()
+
+    # Set up logging
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    parser = argparse.ArgumentParser(description="AI-Powered Scoping Agent")
+    parser.add_argument("--adw-id", required=True, help="Workflow ID")
+    parser.add_argument("--context", help="Additional context (transcripts, Miro boards, etc.)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached agent responses and call Claude Code for every file")
+    parser.add_argument("--resume-from", type=int, metavar="N", help="Regenerate file N and every file scheduled after it in dependency-tier order, keeping earlier files")
+    args = parser.parse_args()
+
+    print(f"\n{'='*80}")
+    print(f"AI-POWERED SCOPING PHASE")
+    print(f"{'='*80}\n")
+    print(f"ADW ID: {args.adw_id}")
+    print(f"Approach: Tiered Claude reasoning (14 files, independent files in parallel)")
+
+    # Load state
+    state = ADWState.load_from_id(args.adw_id)
+    if not state:
+        print(f"\n[ERROR] No state found for ADW ID: {args.adw_id}")
+        print("Run adw_discovery.py first!")
+        sys.exit(1)
+
+    # Check if discovery is complete
+    discovery_brief_path = state.get("discovery.discovery_brief")
+    if not discovery_brief_path:
+        print("\n[ERROR] Discovery phase not complete")
+        sys.exit(1)
+
+    print(f"Discovery brief: {discovery_brief_path}\n")
+
+    # Every state change in the run is written once, atomically, on exit
+    with state.batch():
+        run_scoping(args, state, discovery_brief_path, logger)
+
 if __name__ == "__main__":
     main()
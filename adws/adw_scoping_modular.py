@@ -24,14 +24,28 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 import yaml
 import asyncio
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 import logging
-from typing import Optional, List, Dict, Set, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from graphlib import TopologicalSorter
+from typing import Optional, List, Dict, FrozenSet, NamedTuple, Set, Tuple
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -44,6 +58,7 @@ from adws.adw_modules.cdk_generator import (
     generate_parameter_store_script
 )
 from adws.adw_modules.data_types import InfrastructureConfig
+from adws.adw_modules.utils import write_file_atomic
 
 
 # File dependency graph - which files must be completed before others
@@ -63,28 +78,174 @@ FILE_DEPENDENCIES = {
     14: [9],          # LLM prompts needs architecture
 }
 
-# Parallel execution groups (files that can run simultaneously)
-PARALLEL_GROUPS = [
-    [6, 11],          # ML research + Security (after file 5)
-    [10, 12, 13, 14], # CDK, Cost, Validation, LLM prompts (after file 9)
-]
+# Maximum number of Claude Code agents running at once (override with
+# ADW_MAX_CONCURRENT_AGENTS); extra calls mostly wait on API rate limits
+DEFAULT_MAX_CONCURRENT_AGENTS = 4
+
+
+def _read_max_concurrent_agents() -> int:
+    """Read ADW_MAX_CONCURRENT_AGENTS, falling back to the default if it isn't an integer."""
+    raw = os.getenv("ADW_MAX_CONCURRENT_AGENTS")
+    if raw is None:
+        return DEFAULT_MAX_CONCURRENT_AGENTS
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        print(
+            f"[WARNING] ADW_MAX_CONCURRENT_AGENTS={raw!r} is not an integer, "
+            f"using {DEFAULT_MAX_CONCURRENT_AGENTS}"
+        )
+        return DEFAULT_MAX_CONCURRENT_AGENTS
+
+
+MAX_CONCURRENT_AGENTS = _read_max_concurrent_agents()
+
+# Worker threads used to read prerequisite files concurrently
+MAX_PARALLEL_READS = 8
+
+
+def _compute_prerequisites(file_num: int) -> FrozenSet[int]:
+    """Walk FILE_DEPENDENCIES to collect every transitive prerequisite of a file."""
+    prerequisites = set()
+    to_process = [file_num]
+
+    while to_process:
+        current = to_process.pop()
+        deps = FILE_DEPENDENCIES.get(current, [])
+        for dep in deps:
+            if dep not in prerequisites:
+                prerequisites.add(dep)
+                to_process.append(dep)
+
+    return frozenset(prerequisites)
+
+
+# The dependency graph is static, so closures are computed once at import
+_PREREQ_CLOSURE: Dict[int, FrozenSet[int]] = {
+    file_num: _compute_prerequisites(file_num) for file_num in range(1, 15)
+}
+
+# Reverse graph: files that directly depend on each file
+_SUCCESSORS: Dict[int, FrozenSet[int]] = {
+    file_num: frozenset(n for n, deps in FILE_DEPENDENCIES.items() if file_num in deps)
+    for file_num in range(1, 15)
+}
+
+
+def _compute_descendants(file_num: int) -> FrozenSet[int]:
+    """Collect every file that transitively depends on a file."""
+    return frozenset(n for n, prereqs in _PREREQ_CLOSURE.items() if file_num in prereqs)
+
+
+# Files that can't be generated once a given file fails
+_DESCENDANTS: Dict[int, FrozenSet[int]] = {
+    file_num: _compute_descendants(file_num) for file_num in range(1, 15)
+}
+
+# Existence of scoping files per (adw_id, file_num), kept for the run
+_exists_cache: Dict[Tuple[str, int], bool] = {}
+
+# File contents keyed by path, as (mtime_ns, content)
+_content_cache: Dict[str, Tuple[int, str]] = {}
+
+# Agent latency (seconds) of files generated in this run, keyed by file number
+_latency_samples: Dict[int, float] = {}
+
+# Assumed agent latency (seconds) for files with no recorded history. The
+# architecture and CDK files are the longest generations.
+DEFAULT_FILE_LATENCY = 60.0
+DEFAULT_FILE_LATENCY_OVERRIDES = {9: 90.0, 10: 120.0}
 
+# Per-file record of the prerequisite content each file was generated from,
+# stored in specs/{adw_id}/ so a later --all run can find stale files
+SCOPING_PLAN_FILENAME = ".scoping_plan.json"
+_plan_lock = threading.Lock()
 
+# Per-file latency history, stored in agents/{adw_id}/
+SCOPING_STATS_FILENAME = "scoping_stats.json"
+
+
+class AdwPaths(NamedTuple):
+    """Working paths for one workflow's scoping run."""
+
+    specs: Path
+    agents: Path
+    scoping_logs: Path
+    project: Path
+
+
+@lru_cache(maxsize=8)
+def paths_for(adw_id: str) -> AdwPaths:
+    """Get the (cached) working paths for a workflow.
+
+    Args:
+        adw_id: Workflow ID
+
+    Returns:
+        AdwPaths for the workflow
+    """
+    agents = Path("agents") / adw_id
+    return AdwPaths(
+        specs=Path("specs") / adw_id,
+        agents=agents,
+        scoping_logs=agents / "scoping",
+        project=Path("projects") / f"{adw_id}.md",
+    )
+
+
+@lru_cache(maxsize=1)
 def load_scoping_instructions():
-    """Load scoping file instructions from YAML config."""
+    """Load scoping file instructions from YAML config (parsed once per process).
+
+    The result is cached and shared, so callers must not mutate it.
+    """
     instructions_path = Path(__file__).parent / "scoping_instructions.yaml"
     with open(instructions_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlSafeLoader)
+
+
+@lru_cache(maxsize=1)
+def file_configs_by_num() -> Dict[int, Dict]:
+    """Map file number to its scoping instructions entry.
+
+    Returns:
+        Dict mapping file number to file configuration dict
+    """
+    return {fc['number']: fc for fc in load_scoping_instructions()['files']}
 
 
 def read_file_safe(file_path):
-    """Read file content safely, return empty string if doesn't exist."""
+    """Read file content safely, return empty string if doesn't exist.
+
+    Contents are cached and only re-read when the file's mtime changes, so
+    prerequisites shared by many target files are read from disk once.
+    """
+    key = str(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        mtime = os.stat(key).st_mtime_ns
     except FileNotFoundError:
         return ""
 
+    cached = _content_cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(key, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return ""
+
+    _content_cache[key] = (mtime, content)
+    return content
+
+
+def read_file_if_exists(file_path: Path) -> Optional[str]:
+    """Read a file through read_file_safe, or return None if it doesn't exist."""
+    if not file_path.exists():
+        return None
+    return read_file_safe(file_path)
+
 
 def get_file_config(file_num: int) -> Optional[Dict]:
     """Get configuration for a specific file number.
@@ -95,15 +256,12 @@ def get_file_config(file_num: int) -> Optional[Dict]:
     Returns:
         File configuration dict or None if not found
     """
-    config = load_scoping_instructions()
-    for file_config in config['files']:
-        if file_config['number'] == file_num:
-            return file_config
-    return None
+    return file_configs_by_num().get(file_num)
 
 
+@lru_cache(maxsize=128)
 def summarize_context(context: str, max_length: int = 8000) -> str:
-    """Summarize context if it exceeds max length.
+    """Summarize context if it exceeds max length (memoized per input).
 
     Args:
         context: Full context string
@@ -117,10 +275,49 @@ def summarize_context(context: str, max_length: int = 8000) -> str:
 
     # Simple summarization: take first and last portions
     half = max_length // 2
-    return (
-        context[:half] +
-        "\n\n[... CONTEXT SUMMARIZED FOR LENGTH ...]\n\n" +
-        context[-half:]
+    return "\n\n[... CONTEXT SUMMARIZED FOR LENGTH ...]\n\n".join(
+        (context[:half], context[-half:])
+    )
+
+
+def get_summary_length(context_mode: str, file_num: int, prereq_num: int) -> Optional[int]:
+    """Get the summary length for a prerequisite in a target's context.
+
+    Args:
+        context_mode: 'full' | 'summarized' | 'smart'
+        file_num: Target file number
+        prereq_num: Prerequisite file number
+
+    Returns:
+        Maximum length to summarize to, or None to include the file as-is
+    """
+    # Smart mode: summarize older files, keep recent files full
+    if context_mode == "smart":
+        # Files more than 5 positions back get summarized
+        if file_num - prereq_num > 5:
+            return 2000
+        return None
+    if context_mode == "summarized":
+        return 3000
+    # 'full' mode uses content as-is
+    return None
+
+
+def get_context_layout(file_num: int, context_mode: str) -> Tuple[Tuple[int, Optional[int]], ...]:
+    """Describe which prerequisites a target's context holds and how each is summarized.
+
+    Targets with equal layouts get identical contexts from build_context_for_file.
+
+    Args:
+        file_num: Target file number
+        context_mode: 'full' | 'summarized' | 'smart'
+
+    Returns:
+        Tuple of (prerequisite number, summary length) pairs
+    """
+    return tuple(
+        (prereq_num, get_summary_length(context_mode, file_num, prereq_num))
+        for prereq_num in sorted(get_all_prerequisites(file_num))
     )
 
 
@@ -146,29 +343,29 @@ def build_context_for_file(
     discovery_brief = read_file_safe(discovery_brief_path)
 
     # Check for project file
-    project_file = Path(f"projects/{adw_id}.md")
+    project_file = paths_for(adw_id).project
     project_context = ""
     if project_file.exists():
         project_context = read_file_safe(project_file)
 
-    # Initialize context
-    context = f"""# Project Context
+    # Collect context sections and join once at the end
+    parts: List[str] = [f"""# Project Context
 
 {project_context if project_context else "No project file provided."}
 
 # Discovery Brief (File 1)
 
 {discovery_brief}
-"""
+"""]
 
     # Get all prerequisite files based on dependency graph
     prerequisites = get_all_prerequisites(file_num)
 
-    # Load scoping instructions to get filenames
-    config = load_scoping_instructions()
-    file_configs_map = {fc['number']: fc for fc in config['files']}
+    # Scoping instructions indexed by file number, to get filenames
+    file_configs_map = file_configs_by_num()
 
-    # Add each prerequisite file to context
+    # Resolve prerequisite files first so they can be read concurrently
+    prereq_files = []
     for prereq_num in sorted(prerequisites):
         if prereq_num == 1:  # Skip discovery brief (already included)
             continue
@@ -177,28 +374,27 @@ def build_context_for_file(
         if not file_config:
             continue
 
-        filename = file_config['filename']
-        title = file_config['title']
-        file_path = specs_dir / f"{prereq_num}_{filename}"
+        file_path = specs_dir / f"{prereq_num}_{file_config['filename']}"
+        prereq_files.append((prereq_num, file_config['title'], file_path))
 
-        if file_path.exists():
-            content = read_file_safe(file_path)
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_READS) as executor:
+        contents = list(executor.map(
+            read_file_if_exists, [file_path for _, _, file_path in prereq_files]
+        ))
 
-            # Smart mode: summarize older files, keep recent files full
-            if context_mode == "smart":
-                # Files more than 5 positions back get summarized
-                if file_num - prereq_num > 5:
-                    content = summarize_context(content, max_length=2000)
-            elif context_mode == "summarized":
-                content = summarize_context(content, max_length=3000)
-            # 'full' mode uses content as-is
+    # Add each prerequisite file to context, in file-number order
+    for (prereq_num, title, _), content in zip(prereq_files, contents):
+        if content is not None:
+            max_length = get_summary_length(context_mode, file_num, prereq_num)
+            if max_length is not None:
+                content = summarize_context(content, max_length=max_length)
 
-            context += f"\n\n# {title} (File {prereq_num})\n\n{content}"
+            parts.append(f"# {title} (File {prereq_num})\n\n{content}")
 
-    return context
+    return "\n\n".join(parts)
 
 
-def get_all_prerequisites(file_num: int) -> Set[int]:
+def get_all_prerequisites(file_num: int) -> FrozenSet[int]:
     """Get all prerequisite file numbers (transitive closure).
 
     Args:
@@ -207,23 +403,62 @@ def get_all_prerequisites(file_num: int) -> Set[int]:
     Returns:
         Set of all prerequisite file numbers
     """
-    prerequisites = set()
-    to_process = [file_num]
+    return _PREREQ_CLOSURE.get(file_num, frozenset())
 
-    while to_process:
-        current = to_process.pop()
-        deps = FILE_DEPENDENCIES.get(current, [])
-        for dep in deps:
-            if dep not in prerequisites:
-                prerequisites.add(dep)
-                to_process.append(dep)
 
-    return prerequisites
+def get_spec_filename(file_num: int) -> Optional[str]:
+    """Get the on-disk name of a scoping file (e.g., "2_requirements.md").
+
+    Args:
+        file_num: File number (1-14)
+
+    Returns:
+        File name or None for an unknown file number
+    """
+    # Special case for file 1 (discovery brief - created during discovery phase)
+    if file_num == 1:
+        return "1_discovery_brief.md"
+
+    file_config = get_file_config(file_num)
+    if not file_config:
+        return None
+
+    return f"{file_num}_{file_config['filename']}"
+
+
+def scan_existing_files(adw_id: str) -> Set[int]:
+    """Seed the existence cache for every scoping file with one directory scan.
+
+    Args:
+        adw_id: Workflow ID
+
+    Returns:
+        Set of file numbers (1-14) present on disk
+    """
+    specs_dir = paths_for(adw_id).specs
+    try:
+        with os.scandir(specs_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+
+    existing = set()
+    for file_num in range(1, 15):
+        spec_filename = get_spec_filename(file_num)
+        if spec_filename:
+            exists = spec_filename in present
+            _exists_cache[(adw_id, file_num)] = exists
+            if exists:
+                existing.add(file_num)
+    return existing
 
 
 def check_file_exists(adw_id: str, file_num: int) -> bool:
     """Check if a scoping file already exists.
 
+    Results are cached for the rest of the run; generate_single_file marks
+    files as existing once it writes them.
+
     Args:
         adw_id: Workflow ID
         file_num: File number
@@ -231,21 +466,17 @@ def check_file_exists(adw_id: str, file_num: int) -> bool:
     Returns:
         True if file exists
     """
-    specs_dir = Path(f"specs/{adw_id}")
+    cached = _exists_cache.get((adw_id, file_num))
+    if cached is not None:
+        return cached
 
-    # Special case for file 1 (discovery brief - created during discovery phase)
-    if file_num == 1:
-        file_path = specs_dir / "1_discovery_brief.md"
-        return file_path.exists()
-
-    file_config = get_file_config(file_num)
-    if not file_config:
+    spec_filename = get_spec_filename(file_num)
+    if not spec_filename:
         return False
 
-    filename = file_config['filename']
-    file_path = specs_dir / f"{file_num}_{filename}"
-
-    return file_path.exists()
+    exists = (paths_for(adw_id).specs / spec_filename).exists()
+    _exists_cache[(adw_id, file_num)] = exists
+    return exists
 
 
 def generate_single_file(
@@ -253,7 +484,8 @@ def generate_single_file(
     file_num: int,
     force: bool = False,
     context_mode: str = "smart",
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    shared_context: Optional[str] = None
 ) -> Tuple[bool, str]:
     """Generate a single scoping file.
 
@@ -263,6 +495,8 @@ def generate_single_file(
         force: Regenerate even if file exists
         context_mode: Context management mode
         logger: Optional logger instance
+        shared_context: Context already built for a target with the same
+            layout (see get_context_layout), used instead of rebuilding it
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -292,17 +526,22 @@ def generate_single_file(
             return False, msg
 
     # Create directories
-    specs_dir = Path(f"specs/{adw_id}")
+    paths = paths_for(adw_id)
+    specs_dir = paths.specs
     specs_dir.mkdir(parents=True, exist_ok=True)
 
-    agent_output_dir = Path(f"agents/{adw_id}/scoping")
+    agent_output_dir = paths.scoping_logs
     agent_output_dir.mkdir(parents=True, exist_ok=True)
 
     # Build context
-    logger.info(f"Building context for file {file_num} (mode: {context_mode})")
-    accumulated_context = build_context_for_file(
-        adw_id, file_num, specs_dir, context_mode
-    )
+    if shared_context is not None:
+        logger.info(f"Using shared context for file {file_num} (mode: {context_mode})")
+        accumulated_context = shared_context
+    else:
+        logger.info(f"Building context for file {file_num} (mode: {context_mode})")
+        accumulated_context = build_context_for_file(
+            adw_id, file_num, specs_dir, context_mode
+        )
 
     # Extract file details
     filename = file_config['filename']
@@ -355,7 +594,9 @@ Generate the complete {filename} file now:
 
     # Call Claude Code agent
     logger.info("  Calling Claude Code agent...")
+    started_at = time.monotonic()
     response = prompt_claude_code_with_retry(request, max_retries=2)
+    elapsed = time.monotonic() - started_at
 
     if not response.success:
         msg = f"Failed to generate file {file_num}: {response.output}"
@@ -368,21 +609,236 @@ Generate the complete {filename} file now:
     file_content = response.output.strip()
     file_path = specs_dir / f"{file_num}_{filename}"
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(file_content)
+    write_file_atomic(file_path, file_content)
+    _exists_cache[(adw_id, file_num)] = True
+    _latency_samples[file_num] = elapsed
+    record_generated_file(adw_id, file_num)
 
     msg = f"Successfully generated file {file_num}: {filename}"
     return True, msg
 
 
-def generate_files_parallel(
+def compute_prerequisite_hash(adw_id: str, file_num: int) -> str:
+    """Hash the current content of every (transitive) prerequisite of a file.
+
+    Args:
+        adw_id: Workflow ID
+        file_num: Target file number
+
+    Returns:
+        Hex-encoded BLAKE2b digest
+    """
+    specs_dir = paths_for(adw_id).specs
+    digest = hashlib.blake2b(digest_size=16)
+    for prereq_num in sorted(get_all_prerequisites(file_num)):
+        spec_filename = get_spec_filename(prereq_num)
+        if not spec_filename:
+            continue
+        digest.update(f"{prereq_num}\0".encode())
+        digest.update(read_file_safe(specs_dir / spec_filename).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_scoping_plan(adw_id: str) -> Dict[str, Dict]:
+    """Load the per-file generation records for a workflow.
+
+    Args:
+        adw_id: Workflow ID
+
+    Returns:
+        Dict mapping file number (as a string) to its record
+    """
+    try:
+        with open(paths_for(adw_id).specs / SCOPING_PLAN_FILENAME, 'r') as f:
+            return json.load(f).get("files", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def record_generated_file(adw_id: str, file_num: int) -> None:
+    """Record the prerequisite hash and completion time of a generated file.
+
+    Args:
+        adw_id: Workflow ID
+        file_num: File number that was just generated
+    """
+    record = {
+        "prereq_hash": compute_prerequisite_hash(adw_id, file_num),
+        "completed_at": datetime.now().isoformat(),
+    }
+    with _plan_lock:
+        files = load_scoping_plan(adw_id)
+        files[str(file_num)] = record
+        write_file_atomic(
+            paths_for(adw_id).specs / SCOPING_PLAN_FILENAME,
+            json.dumps({"files": files}, indent=2)
+        )
+
+
+def get_stale_files(adw_id: str, existing: Set[int]) -> List[int]:
+    """Find existing files whose prerequisites changed since they were generated.
+
+    Files without a record (generated before records were kept) are
+    treated as current.
+
+    Args:
+        adw_id: Workflow ID
+        existing: File numbers present on disk
+
+    Returns:
+        Sorted list of stale file numbers
+    """
+    plan = load_scoping_plan(adw_id)
+    stale = []
+    for file_num in sorted(existing):
+        record = plan.get(str(file_num))
+        if record and record.get("prereq_hash") != compute_prerequisite_hash(adw_id, file_num):
+            stale.append(file_num)
+    return stale
+
+
+def get_scoping_stats_path(adw_id: str) -> Path:
+    """Get the path of the per-file latency history for a workflow."""
+    return paths_for(adw_id).agents / SCOPING_STATS_FILENAME
+
+
+def load_file_latencies(adw_id: str) -> Dict[int, float]:
+    """Load average agent latency per file from previous runs.
+
+    Args:
+        adw_id: Workflow ID
+
+    Returns:
+        Dict mapping file number to average latency in seconds
+    """
+    try:
+        with open(get_scoping_stats_path(adw_id), 'r') as f:
+            stats = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    return {
+        int(file_num): entry["avg_seconds"]
+        for file_num, entry in stats.get("files", {}).items()
+    }
+
+
+def record_file_latencies(adw_id: str, samples: Dict[int, float]) -> None:
+    """Fold this run's latency samples into the persisted running averages.
+
+    Args:
+        adw_id: Workflow ID
+        samples: Dict mapping file number to latency in seconds
+    """
+    if not samples:
+        return
+
+    stats_path = get_scoping_stats_path(adw_id)
+    try:
+        with open(stats_path, 'r') as f:
+            stats = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        stats = {}
+
+    files = stats.setdefault("files", {})
+    for file_num, seconds in samples.items():
+        entry = files.setdefault(str(file_num), {"avg_seconds": 0.0, "samples": 0})
+        entry["samples"] += 1
+        entry["avg_seconds"] += (seconds - entry["avg_seconds"]) / entry["samples"]
+
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(stats_path, 'w') as f:
+        json.dump(stats, f, indent=2)
+
+
+def flush_latency_samples(adw_id: str) -> None:
+    """Persist the latency samples collected so far in this run and reset them.
+
+    Every generation path (single file, sequential, parallel, DAG) calls this
+    once it is done, so no path's samples are dropped.
+
+    Args:
+        adw_id: Workflow ID
+    """
+    record_file_latencies(adw_id, _latency_samples)
+    _latency_samples.clear()
+
+
+def compute_critical_path_priority(
+    file_nums: List[int],
+    latencies: Dict[int, float]
+) -> Dict[int, float]:
+    """Compute each file's longest remaining path (in seconds) to the end of the run.
+
+    Starting ready files with the highest value first keeps the critical
+    path moving when concurrency is capped.
+
+    Args:
+        file_nums: File numbers being generated
+        latencies: Known average latency per file
+
+    Returns:
+        Dict mapping file number to priority (higher runs first)
+    """
+    targets = set(file_nums)
+    order = TopologicalSorter({
+        file_num: [dep for dep in FILE_DEPENDENCIES.get(file_num, []) if dep in targets]
+        for file_num in file_nums
+    }).static_order()
+
+    priority: Dict[int, float] = {}
+    for file_num in reversed(list(order)):
+        latency = latencies.get(
+            file_num, DEFAULT_FILE_LATENCY_OVERRIDES.get(file_num, DEFAULT_FILE_LATENCY)
+        )
+        downstream = [priority[n] for n in _SUCCESSORS.get(file_num, ()) if n in targets]
+        priority[file_num] = latency + max(downstream, default=0.0)
+
+    return priority
+
+
+async def generate_single_file_async(
+    adw_id: str,
+    file_num: int,
+    semaphore: asyncio.Semaphore,
+    force: bool = False,
+    context_mode: str = "smart",
+    logger: Optional[logging.Logger] = None,
+    shared_context: Optional[str] = None
+) -> Tuple[bool, str]:
+    """Generate a single scoping file without blocking the event loop.
+
+    The agent call is a blocking subprocess, so it runs in a worker thread;
+    the semaphore bounds how many run at once.
+
+    Args:
+        adw_id: Workflow ID
+        file_num: File number (2-14)
+        semaphore: Semaphore limiting concurrent agent calls
+        force: Regenerate even if file exists
+        context_mode: Context management mode
+        logger: Optional logger instance
+        shared_context: Prebuilt context to use instead of building one
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    async with semaphore:
+        return await asyncio.to_thread(
+            generate_single_file, adw_id, file_num, force, context_mode, logger,
+            shared_context
+        )
+
+
+async def generate_files_parallel(
     adw_id: str,
     file_nums: List[int],
     force: bool = False,
     context_mode: str = "smart",
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    max_concurrency: int = MAX_CONCURRENT_AGENTS
 ) -> Dict[int, Tuple[bool, str]]:
-    """Generate multiple files in parallel.
+    """Generate multiple files concurrently.
 
     Args:
         adw_id: Workflow ID
@@ -390,6 +846,7 @@ def generate_files_parallel(
         force: Regenerate even if files exist
         context_mode: Context management mode
         logger: Optional logger instance
+        max_concurrency: Maximum number of concurrent agent calls
 
     Returns:
         Dict mapping file_num to (success, message) tuples
@@ -397,30 +854,120 @@ def generate_files_parallel(
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    # Targets with the same prerequisites and summarization share one context
+    by_layout: Dict[Tuple, List[int]] = {}
+    for file_num in file_nums:
+        by_layout.setdefault(get_context_layout(file_num, context_mode), []).append(file_num)
+
+    specs_dir = paths_for(adw_id).specs
+    shared_contexts: Dict[int, str] = {}
+    for group in by_layout.values():
+        if len(group) > 1:
+            context = await asyncio.to_thread(
+                build_context_for_file, adw_id, group[0], specs_dir, context_mode
+            )
+            shared_contexts.update((file_num, context) for file_num in group)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    outcomes = await asyncio.gather(
+        *[
+            generate_single_file_async(
+                adw_id, file_num, semaphore, force, context_mode, logger,
+                shared_contexts.get(file_num)
+            )
+            for file_num in file_nums
+        ],
+        return_exceptions=True
+    )
+
     results = {}
+    for file_num, outcome in zip(file_nums, outcomes):
+        if isinstance(outcome, Exception):
+            results[file_num] = (False, f"Exception: {str(outcome)}")
+        else:
+            results[file_num] = outcome
 
-    with ThreadPoolExecutor(max_workers=len(file_nums)) as executor:
-        # Submit all tasks
-        future_to_file = {
-            executor.submit(
-                generate_single_file,
-                adw_id,
-                file_num,
-                force,
-                context_mode,
-                logger
-            ): file_num
-            for file_num in file_nums
-        }
+    flush_latency_samples(adw_id)
+
+    return results
 
-        # Collect results as they complete
-        for future in as_completed(future_to_file):
-            file_num = future_to_file[future]
+
+async def generate_files_dag(
+    adw_id: str,
+    file_nums: List[int],
+    force: bool = False,
+    context_mode: str = "smart",
+    logger: Optional[logging.Logger] = None,
+    max_concurrency: int = MAX_CONCURRENT_AGENTS
+) -> Dict[int, Tuple[bool, str]]:
+    """Generate files in dependency order, starting each one as soon as it is ready.
+
+    Unlike running the graph level by level, a finished file immediately
+    unblocks its dependents instead of waiting for the rest of its level.
+    Dependencies outside file_nums are assumed to already exist.
+
+    Args:
+        adw_id: Workflow ID
+        file_nums: List of file numbers to generate
+        force: Regenerate even if files exist
+        context_mode: Context management mode
+        logger: Optional logger instance
+        max_concurrency: Maximum number of concurrent agent calls
+
+    Returns:
+        Dict mapping every file_num to (success, message) tuples
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    targets = set(file_nums)
+    sorter = TopologicalSorter({
+        file_num: [dep for dep in FILE_DEPENDENCIES.get(file_num, []) if dep in targets]
+        for file_num in file_nums
+    })
+    sorter.prepare()
+
+    priority = compute_critical_path_priority(file_nums, load_file_latencies(adw_id))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    inflight: Dict[asyncio.Task, int] = {}
+    results: Dict[int, Tuple[bool, str]] = {}
+
+    while sorter.is_active():
+        # Semaphore waiters are served in order, so longest paths start first
+        for file_num in sorted(sorter.get_ready(), key=priority.get, reverse=True):
+            task = asyncio.create_task(generate_single_file_async(
+                adw_id, file_num, semaphore, force, context_mode, logger
+            ))
+            inflight[task] = file_num
+
+        # Only files skipped behind a failure are left
+        if not inflight:
+            break
+
+        done, _ = await asyncio.wait(set(inflight), return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            file_num = inflight.pop(task)
             try:
-                success, message = future.result()
-                results[file_num] = (success, message)
+                success, message = task.result()
             except Exception as e:
-                results[file_num] = (False, f"Exception: {str(e)}")
+                success, message = False, f"Exception: {str(e)}"
+
+            results[file_num] = (success, message)
+            logger.info(f"  File {file_num}: {message}")
+
+            if success:
+                sorter.done(file_num)
+            else:
+                # A failed file is never marked done, so its dependents never
+                # start; report them all at once
+                skipped = sorted((_DESCENDANTS.get(file_num, frozenset()) & targets) - results.keys())
+                if skipped:
+                    logger.error(f"  Skipping {len(skipped)} downstream file(s) of file {file_num}: {skipped}")
+                    for skipped_num in skipped:
+                        results[skipped_num] = (False, f"Skipped file {skipped_num}: upstream file {file_num} failed")
+
+    flush_latency_samples(adw_id)
 
     return results
 
@@ -434,11 +981,9 @@ def get_missing_files(adw_id: str) -> List[int]:
     Returns:
         List of missing file numbers (2-14)
     """
-    missing = []
-    for file_num in range(2, 15):  # Files 2-14
-        if not check_file_exists(adw_id, file_num):
-            missing.append(file_num)
-    return missing
+    # One scandir of the specs directory instead of a stat per file
+    existing = scan_existing_files(adw_id)
+    return [file_num for file_num in range(2, 15) if file_num not in existing]  # Files 2-14
 
 
 def generate_all_files(
@@ -463,12 +1008,22 @@ def generate_all_files(
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    # Determine which files need generation
+    # Determine which files need generation; either way one directory scan
+    # answers every existence check in this run
     if force:
+        scan_existing_files(adw_id)
         files_to_generate = list(range(2, 15))
     else:
         files_to_generate = get_missing_files(adw_id)
 
+        # Regenerate files built from prerequisites that have since changed
+        stale = get_stale_files(adw_id, set(range(2, 15)) - set(files_to_generate))
+        if stale:
+            logger.info(f"Prerequisites changed since generation, regenerating: {stale}")
+            for file_num in stale:
+                _exists_cache[(adw_id, file_num)] = False
+            files_to_generate = sorted(set(files_to_generate) | set(stale))
+
     if not files_to_generate:
         logger.info("All scoping files already exist!")
         return True
@@ -479,68 +1034,37 @@ def generate_all_files(
     generated_count = 0
 
     if parallel:
-        # Use parallel execution groups
+        # Each file starts as soon as its own prerequisites finish
         logger.info("Using parallel execution where possible")
 
-        # Process files in dependency order with parallelization
-        remaining = set(files_to_generate)
-
-        while remaining:
-            # Find files that can run now (all dependencies met)
-            ready = []
-            for file_num in remaining:
-                deps = FILE_DEPENDENCIES.get(file_num, [])
-                deps_met = all(
-                    check_file_exists(adw_id, dep) or dep not in files_to_generate
-                    for dep in deps
-                )
-                if deps_met:
-                    ready.append(file_num)
-
-            if not ready:
-                logger.error("Circular dependency or missing prerequisites!")
-                return False
-
-            # Check if ready files can run in parallel
-            can_parallelize = False
-            for group in PARALLEL_GROUPS:
-                if set(ready).issubset(set(group)):
-                    can_parallelize = True
-                    break
-
-            if can_parallelize and len(ready) > 1:
-                # Run in parallel
-                logger.info(f"Generating files {ready} in parallel...")
-                results = generate_files_parallel(
-                    adw_id, ready, force, context_mode, logger
-                )
+        results = asyncio.run(generate_files_dag(
+            adw_id, files_to_generate, force, context_mode, logger
+        ))
 
-                for file_num, (success, message) in results.items():
-                    logger.info(f"  File {file_num}: {message}")
-                    if success:
-                        generated_count += 1
-                        remaining.remove(file_num)
-                    else:
-                        all_success = False
+        for file_num in files_to_generate:
+            success, _ = results[file_num]
+            if success:
+                generated_count += 1
             else:
-                # Run sequentially
-                for file_num in ready:
-                    success, message = generate_single_file(
-                        adw_id, file_num, force, context_mode, logger
-                    )
-                    logger.info(f"  {message}")
-
-                    if success:
-                        generated_count += 1
-                        remaining.remove(file_num)
-                    else:
-                        all_success = False
+                all_success = False
 
     else:
-        # Sequential execution
+        # Sequential execution, in dependency order (file 11 comes before 7)
         logger.info("Using sequential execution")
 
-        for file_num in files_to_generate:
+        targets = set(files_to_generate)
+        ordered = TopologicalSorter({
+            file_num: [dep for dep in FILE_DEPENDENCIES.get(file_num, []) if dep in targets]
+            for file_num in files_to_generate
+        }).static_order()
+
+        poisoned: Set[int] = set()
+        for file_num in ordered:
+            # Don't spend an agent call on a file whose prerequisite failed
+            if file_num in poisoned:
+                all_success = False
+                continue
+
             success, message = generate_single_file(
                 adw_id, file_num, force, context_mode, logger
             )
@@ -550,7 +1074,13 @@ def generate_all_files(
                 generated_count += 1
             else:
                 all_success = False
-                # Continue with next file even if one fails
+                # Continue with files that don't depend on this one
+                skipped = (_DESCENDANTS.get(file_num, frozenset()) & targets) - poisoned
+                if skipped:
+                    logger.error(f"  Skipping {len(skipped)} downstream file(s) of file {file_num}: {sorted(skipped)}")
+                    poisoned |= skipped
+
+        flush_latency_samples(adw_id)
 
     logger.info(f"\n{'='*80}")
     logger.info(f"GENERATION COMPLETE")
@@ -618,6 +1148,7 @@ def main():
             args.context_mode,
             logger
         )
+        flush_latency_samples(args.adw_id)
         print(f"\n{message}")
         sys.exit(0 if success else 1)
 
@@ -627,9 +1158,9 @@ def main():
         print(f"Generating files: {file_nums}\n")
 
         if parallel and len(file_nums) > 1:
-            results = generate_files_parallel(
+            results = asyncio.run(generate_files_parallel(
                 args.adw_id, file_nums, args.force, args.context_mode, logger
-            )
+            ))
             all_success = all(success for success, _ in results.values())
         else:
             all_success = True
@@ -639,6 +1170,7 @@ def main():
                 )
                 print(f"{message}")
                 all_success = all_success and success
+            flush_latency_samples(args.adw_id)
 
         sys.exit(0 if all_success else 1)
 
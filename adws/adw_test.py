@@ -6,7 +6,7 @@
 """ADW Test - AI Developer Workflow for agentic testing in isolated worktrees.
 
 Usage:
-    uv run adw_test.py --adw-id <adw-id> [--issue-number <number>] [--skip-e2e]
+    uv run adw_test.py --adw-id <adw-id> [--issue-number <number>] [--skip-e2e] [--parallel-resolution]
 
 Workflow:
 1. Load state and validate worktree exists
@@ -19,15 +19,17 @@ This workflow REQUIRES that adw_planning.py has been run first to create the wor
 """
 
 import argparse
-import json
 import sys
 import logging
-from typing import Tuple, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, Optional, List, TypeVar
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports when run as a script; importing
+# this module as part of the adws package leaves sys.path untouched
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from adws.adw_modules.data_types import (
     AgentTemplateRequest,
@@ -38,20 +40,18 @@ from adws.adw_modules.data_types import (
 )
 from adws.adw_modules.agent import execute_template
 from adws.adw_modules.github import (
-    extract_repo_path,
     fetch_issue,
-    make_issue_comment,
     get_repo_url,
+    extract_repo_path,
+    CommentBatcher,
 )
 from adws.adw_modules.utils import setup_logger, parse_json
 from adws.adw_modules.state import ADWState
-from adws.adw_modules.git_ops import commit_changes, finalize_git_operations
 from adws.adw_modules.workflow_ops import (
-    format_issue_message,
     create_commit,
     classify_issue,
+    format_issue_message,
 )
-from adws.adw_modules.worktree_ops import validate_worktree
 
 # Agent name constants
 AGENT_TESTER = "test_runner"
@@ -61,6 +61,19 @@ AGENT_E2E_TESTER = "e2e_test_runner"
 MAX_TEST_RETRY_ATTEMPTS = 4
 MAX_E2E_TEST_RETRY_ATTEMPTS = 2
 
+# Failed-test resolvers run one at a time by default: they all edit the same
+# worktree, so concurrent fixes touching a shared file overwrite each other
+MAX_CONCURRENT_TEST_RESOLVERS = 1
+
+# Resolvers run at once with --parallel-resolution
+PARALLEL_TEST_RESOLVERS = 4
+
+# Above this many passed tests, list them by name instead of full JSON
+PASSED_TESTS_JSON_THRESHOLD = 10
+
+# Either unit or E2E test result, for helpers shared by both
+T = TypeVar("T", TestResult, E2ETestResult)
+
 
 def run_tests(adw_id: str, logger: logging.Logger, working_dir: Optional[str] = None) -> AgentPromptResponse:
     """Run the test suite using the /test command."""
@@ -72,67 +85,74 @@ def run_tests(adw_id: str, logger: logging.Logger, working_dir: Optional[str] =
         working_dir=working_dir,
     )
 
-    logger.debug(f"test_template_request: {test_template_request.model_dump_json(indent=2, by_alias=True)}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("test_template_request: %s", test_template_request.model_dump_json(indent=2, by_alias=True))
     test_response = execute_template(test_template_request)
-    logger.debug(f"test_response: {test_response.model_dump_json(indent=2, by_alias=True)}")
+    if debug_enabled:
+        logger.debug("test_response: %s", test_response.model_dump_json(indent=2, by_alias=True))
 
     return test_response
 
 
-def parse_test_results(output: str, logger: logging.Logger) -> Tuple[List[TestResult], int, int]:
-    """Parse test results JSON and return (results, passed_count, failed_count)."""
+def partition_results(results: List[T]) -> Tuple[List[T], List[T]]:
+    """Split test results into (passed, failed) in a single pass."""
+    passed: List[T] = []
+    failed: List[T] = []
+    for test in results:
+        (passed if test.passed else failed).append(test)
+    return passed, failed
+
+
+def parse_test_results(
+    output: str, logger: logging.Logger
+) -> Tuple[List[TestResult], List[TestResult], List[TestResult]]:
+    """Parse test results JSON and return (results, passed_tests, failed_tests)."""
     try:
         results = parse_json(output, List[TestResult])
-        passed_count = sum(1 for test in results if test.passed)
-        failed_count = len(results) - passed_count
-        return results, passed_count, failed_count
+        passed_tests, failed_tests = partition_results(results)
+        return results, passed_tests, failed_tests
     except Exception as e:
         logger.error(f"Error parsing test results: {e}")
-        return [], 0, 0
+        return [], [], []
+
 
+def _format_test_block(test: TestResult) -> str:
+    """Render one test as a heading plus its JSON in a fenced block."""
+    return f"### {test.test_name}\n\n```json\n{test.model_dump_json(indent=2)}\n```\n"
 
-def format_test_results_comment(results: List[TestResult], passed_count: int, failed_count: int) -> str:
+
+def format_test_results_comment(
+    results: List[TestResult], passed_tests: List[TestResult], failed_tests: List[TestResult]
+) -> str:
     """Format test results for GitHub issue comment with JSON blocks."""
     if not results:
         return "❌ No test results found"
 
-    failed_tests = [test for test in results if not test.passed]
-    passed_tests = [test for test in results if test.passed]
-
-    comment_parts = []
+    sections = []
 
     # Failed tests section
     if failed_tests:
-        comment_parts.append("")
-        comment_parts.append("## ❌ Failed Tests")
-        comment_parts.append("")
-        for test in failed_tests:
-            comment_parts.append(f"### {test.test_name}")
-            comment_parts.append("")
-            comment_parts.append("```json")
-            comment_parts.append(json.dumps(test.model_dump(), indent=2))
-            comment_parts.append("```")
-            comment_parts.append("")
-
-    # Passed tests section
+        sections.append("\n## ❌ Failed Tests\n")
+        sections.extend(map(_format_test_block, failed_tests))
+
+    # Passed tests section; large green runs only need the names
     if passed_tests:
-        comment_parts.append("## ✅ Passed Tests")
-        comment_parts.append("")
-        for test in passed_tests:
-            comment_parts.append(f"### {test.test_name}")
-            comment_parts.append("")
-            comment_parts.append("```json")
-            comment_parts.append(json.dumps(test.model_dump(), indent=2))
-            comment_parts.append("```")
-            comment_parts.append("")
+        sections.append("## ✅ Passed Tests\n")
+        if len(passed_tests) > PASSED_TESTS_JSON_THRESHOLD:
+            sections.append("".join(f"- ✅ {test.test_name}\n" for test in passed_tests))
+        else:
+            sections.extend(map(_format_test_block, passed_tests))
 
     # Summary
-    comment_parts.append("## Summary")
-    comment_parts.append(f"- **Passed**: {passed_count}")
-    comment_parts.append(f"- **Failed**: {failed_count}")
-    comment_parts.append(f"- **Total**: {len(results)}")
+    sections.append(
+        f"## Summary\n"
+        f"- **Passed**: {len(passed_tests)}\n"
+        f"- **Failed**: {len(failed_tests)}\n"
+        f"- **Total**: {len(results)}"
+    )
 
-    return "\n".join(comment_parts)
+    return "\n".join(sections)
 
 
 def run_e2e_tests(adw_id: str, logger: logging.Logger, working_dir: Optional[str] = None) -> AgentPromptResponse:
@@ -149,413 +169,417 @@ def run_e2e_tests(adw_id: str, logger: logging.Logger, working_dir: Optional[str
         working_dir=working_dir,
     )
 
-    logger.debug(f"e2e_test_template_request: {test_template_request.model_dump_json(indent=2, by_alias=True)}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("e2e_test_template_request: %s", test_template_request.model_dump_json(indent=2, by_alias=True))
     test_response = execute_template(test_template_request)
-    logger.debug(f"e2e_test_response: {test_response.model_dump_json(indent=2, by_alias=True)}")
+    if debug_enabled:
+        logger.debug("e2e_test_response: %s", test_response.model_dump_json(indent=2, by_alias=True))
 
     return test_response
 
 
-def parse_e2e_test_results(output: str, logger: logging.Logger) -> Tuple[List[E2ETestResult], int, int]:
-    """Parse E2E test results JSON and return (results, passed_count, failed_count)."""
+def parse_e2e_test_results(
+    output: str, logger: logging.Logger
+) -> Tuple[List[E2ETestResult], List[E2ETestResult], List[E2ETestResult]]:
+    """Parse E2E test results JSON and return (results, passed_tests, failed_tests)."""
     try:
         results = parse_json(output, List[E2ETestResult])
-        passed_count = sum(1 for test in results if test.passed)
-        failed_count = len(results) - passed_count
-        return results, passed_count, failed_count
+        passed_tests, failed_tests = partition_results(results)
+        return results, passed_tests, failed_tests
     except Exception as e:
         logger.error(f"Error parsing E2E test results: {e}")
-        return [], 0, 0
+        return [], [], []
 
 
-def resolve_failed_tests(
-    failed_tests: List[TestResult],
+def run_resolvers(
+    slash_command: str,
+    agent_names: List[str],
+    payloads: List[str],
     adw_id: str,
-    issue_number: Optional[str],
+    worktree_path: str,
+    max_workers: int,
+) -> List[AgentPromptResponse]:
+    """Run one resolver agent per failed test, up to max_workers at a time.
+
+    Args:
+        slash_command: Resolver command (e.g., "/resolve_failed_test")
+        agent_names: Agent name for each resolver
+        payloads: JSON test payload for each resolver
+        adw_id: ADW workflow ID
+        worktree_path: Worktree the resolvers edit
+        max_workers: Concurrency limit; 1 runs the resolvers serially
+
+    Returns:
+        Resolver responses, in the same order as agent_names
+    """
+    requests = [
+        AgentTemplateRequest(
+            agent_name=agent_name,
+            slash_command=slash_command,
+            args=[payload],
+            adw_id=adw_id,
+            working_dir=worktree_path,
+        )
+        for agent_name, payload in zip(agent_names, payloads)
+    ]
+
+    if max_workers <= 1 or len(requests) <= 1:
+        return [execute_template(request) for request in requests]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+        return list(executor.map(execute_template, requests))
+
+
+def resolve_failed(
+    failed_tests: List[T],
+    adw_id: str,
+    comments: CommentBatcher,
     logger: logging.Logger,
     worktree_path: str,
-    iteration: int = 1,
+    iteration: int,
+    max_workers: int,
+    slash_command: str,
+    agent_prefix: str,
+    kind: str = "",
 ) -> Tuple[int, int]:
-    """Attempt to resolve failed tests using the resolve_failed_test command.
-    Returns (resolved_count, unresolved_count).
+    """Attempt to resolve failed tests with one resolver agent per test.
+
+    With max_workers > 1 the resolvers run concurrently; comments are posted
+    from this thread in test order either way.
+
+    Args:
+        failed_tests: Failed unit or E2E test results
+        adw_id: ADW workflow ID
+        comments: Batcher that coalesces issue status comments
+        logger: Logger instance
+        worktree_path: Worktree the resolvers edit
+        iteration: Retry attempt number, used in agent names
+        max_workers: Concurrency limit; 1 runs the resolvers serially
+        slash_command: Resolver command (e.g., "/resolve_failed_test")
+        agent_prefix: Agent name prefix (e.g., "test_resolver")
+        kind: Prefix for log and comment wording ("" or "E2E ")
+
+    Returns:
+        (resolved_count, unresolved_count)
     """
     resolved_count = 0
     unresolved_count = 0
+    subject = f" {kind}test" if kind else ""
 
-    for idx, test in enumerate(failed_tests):
-        logger.info(f"\n=== Resolving failed test {idx + 1}/{len(failed_tests)}: {test.test_name} ===")
+    payloads = [test.model_dump_json(indent=2) for test in failed_tests]
+    agent_names = [f"{agent_prefix}_iter{iteration}_{idx}" for idx in range(len(failed_tests))]
 
-        test_payload = test.model_dump_json(indent=2)
-        agent_name = f"test_resolver_iter{iteration}_{idx}"
-
-        resolve_request = AgentTemplateRequest(
-            agent_name=agent_name,
-            slash_command="/resolve_failed_test",
-            args=[test_payload],
-            adw_id=adw_id,
-            working_dir=worktree_path,
+    for idx, (test, test_payload, agent_name) in enumerate(zip(failed_tests, payloads, agent_names)):
+        logger.info(f"\n=== Resolving failed {kind}test {idx + 1}/{len(failed_tests)}: {test.test_name} ===")
+        comments.append(
+            format_issue_message(
+                adw_id,
+                agent_name,
+                f"🔧 Attempting to resolve{subject}: {test.test_name}\n```json\n{test_payload}\n```",
+            )
         )
 
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(
-                    adw_id,
-                    agent_name,
-                    f"🔧 Attempting to resolve: {test.test_name}\n```json\n{test_payload}\n```",
-                ),
-            )
+    # Show what is being worked on before the resolvers start
+    comments.flush()
 
-        response = execute_template(resolve_request)
+    responses = run_resolvers(slash_command, agent_names, payloads, adw_id, worktree_path, max_workers)
 
+    for test, agent_name, response in zip(failed_tests, agent_names, responses):
         if response.success:
             resolved_count += 1
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, agent_name, f"✅ Successfully resolved: {test.test_name}"),
-                )
-            logger.info(f"Successfully resolved: {test.test_name}")
+            comments.append(
+                format_issue_message(adw_id, agent_name, f"✅ Successfully resolved{subject}: {test.test_name}")
+            )
+            logger.info(f"Successfully resolved{subject}: {test.test_name}")
         else:
             unresolved_count += 1
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, agent_name, f"❌ Failed to resolve: {test.test_name}"),
-                )
-            logger.error(f"Failed to resolve: {test.test_name}")
+            comments.append(
+                format_issue_message(adw_id, agent_name, f"❌ Failed to resolve{subject}: {test.test_name}")
+            )
+            logger.error(f"Failed to resolve{subject}: {test.test_name}")
 
     return resolved_count, unresolved_count
 
 
-def run_tests_with_resolution(
+def resolve_failed_tests(
+    failed_tests: List[TestResult],
     adw_id: str,
-    issue_number: Optional[str],
+    comments: CommentBatcher,
     logger: logging.Logger,
     worktree_path: str,
-    max_attempts: int = MAX_TEST_RETRY_ATTEMPTS,
-) -> Tuple[List[TestResult], int, int, AgentPromptResponse]:
-    """Run tests with automatic resolution and retry logic.
-    Returns (results, passed_count, failed_count, last_test_response).
+    iteration: int = 1,
+    max_workers: int = MAX_CONCURRENT_TEST_RESOLVERS,
+) -> Tuple[int, int]:
+    """Attempt to resolve failed tests using the resolve_failed_test command.
+    Returns (resolved_count, unresolved_count).
     """
-    attempt = 0
-    results = []
-    passed_count = 0
-    failed_count = 0
-    test_response = None
-
-    while attempt < max_attempts:
-        attempt += 1
-        logger.info(f"\n=== Test Run Attempt {attempt}/{max_attempts} ===")
-
-        test_response = run_tests(adw_id, logger, worktree_path)
-
-        if not test_response.success:
-            logger.error(f"Error running tests: {test_response.output}")
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, AGENT_TESTER, f"❌ Error running tests: {test_response.output}"),
-                )
-            break
-
-        results, passed_count, failed_count = parse_test_results(test_response.output, logger)
-
-        if failed_count == 0:
-            logger.info("All tests passed, stopping retry attempts")
-            break
-        if attempt == max_attempts:
-            logger.info(f"Reached maximum retry attempts ({max_attempts}), stopping")
-            break
-
-        logger.info("\n=== Attempting to resolve failed tests ===")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(adw_id, "ops", f"🔧 Found {failed_count} failed tests. Attempting resolution..."),
-            )
-
-        failed_tests = [test for test in results if not test.passed]
-        resolved, unresolved = resolve_failed_tests(
-            failed_tests, adw_id, issue_number, logger, worktree_path, iteration=attempt
-        )
-
-        if resolved > 0:
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, "ops", f"✅ Resolved {resolved}/{failed_count} failed tests"),
-                )
-            logger.info(f"\n=== Re-running tests after resolving {resolved} tests ===")
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(
-                        adw_id, AGENT_TESTER, f"🔄 Re-running tests (attempt {attempt + 1}/{max_attempts})..."
-                    ),
-                )
-        else:
-            logger.info("No tests were resolved, stopping retry attempts")
-            break
-
-    if attempt == max_attempts and failed_count > 0:
-        logger.warning(f"Reached maximum retry attempts ({max_attempts}) with {failed_count} failures remaining")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(
-                    adw_id, "ops", f"⚠️ Reached maximum retry attempts ({max_attempts}) with {failed_count} failures"
-                ),
-            )
-
-    return results, passed_count, failed_count, test_response
+    return resolve_failed(
+        failed_tests, adw_id, comments, logger, worktree_path, iteration, max_workers,
+        slash_command="/resolve_failed_test", agent_prefix="test_resolver",
+    )
 
 
 def resolve_failed_e2e_tests(
     failed_tests: List[E2ETestResult],
     adw_id: str,
-    issue_number: Optional[str],
+    comments: CommentBatcher,
     logger: logging.Logger,
     worktree_path: str,
     iteration: int = 1,
+    max_workers: int = MAX_CONCURRENT_TEST_RESOLVERS,
 ) -> Tuple[int, int]:
     """Attempt to resolve failed E2E tests using the resolve_failed_e2e_test command.
     Returns (resolved_count, unresolved_count).
     """
-    resolved_count = 0
-    unresolved_count = 0
-
-    for idx, test in enumerate(failed_tests):
-        logger.info(f"\n=== Resolving failed E2E test {idx + 1}/{len(failed_tests)}: {test.test_name} ===")
-
-        test_payload = test.model_dump_json(indent=2)
-        agent_name = f"e2e_test_resolver_iter{iteration}_{idx}"
-
-        resolve_request = AgentTemplateRequest(
-            agent_name=agent_name,
-            slash_command="/resolve_failed_e2e_test",
-            args=[test_payload],
-            adw_id=adw_id,
-            working_dir=worktree_path,
-        )
-
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(
-                    adw_id, agent_name, f"🔧 Attempting to resolve E2E test: {test.test_name}\n```json\n{test_payload}\n```"
-                ),
-            )
-
-        response = execute_template(resolve_request)
-
-        if response.success:
-            resolved_count += 1
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, agent_name, f"✅ Successfully resolved E2E test: {test.test_name}"),
-                )
-            logger.info(f"Successfully resolved E2E test: {test.test_name}")
-        else:
-            unresolved_count += 1
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, agent_name, f"❌ Failed to resolve E2E test: {test.test_name}"),
-                )
-            logger.error(f"Failed to resolve E2E test: {test.test_name}")
-
-    return resolved_count, unresolved_count
+    return resolve_failed(
+        failed_tests, adw_id, comments, logger, worktree_path, iteration, max_workers,
+        slash_command="/resolve_failed_e2e_test", agent_prefix="e2e_test_resolver", kind="E2E ",
+    )
 
 
-def run_e2e_tests_with_resolution(
+def run_with_resolution(
     adw_id: str,
-    issue_number: Optional[str],
+    comments: CommentBatcher,
     logger: logging.Logger,
     worktree_path: str,
-    max_attempts: int = MAX_E2E_TEST_RETRY_ATTEMPTS,
-) -> Tuple[List[E2ETestResult], int, int]:
-    """Run E2E tests with automatic resolution and retry logic.
-    Returns (results, passed_count, failed_count).
+    max_attempts: int,
+    max_resolvers: int,
+    runner: Callable[[str, logging.Logger, Optional[str]], AgentPromptResponse],
+    parser: Callable[[str, logging.Logger], Tuple[List[T], List[T], List[T]]],
+    resolver: Callable[..., Tuple[int, int]],
+    agent_name: str,
+    kind: str = "",
+) -> Tuple[List[T], List[T], List[T], Optional[AgentPromptResponse]]:
+    """Run a test suite, resolving failures and re-running until it passes.
+
+    Stops early when the run errors, nothing parses, everything passes, no
+    test was resolved, or a resolution round left the same tests failing.
+
+    Args:
+        adw_id: ADW workflow ID
+        comments: Batcher that coalesces issue status comments
+        logger: Logger instance
+        worktree_path: Worktree to run the tests in
+        max_attempts: Maximum number of test runs
+        max_resolvers: Maximum number of resolvers to run at once
+        runner: Runs the suite (run_tests or run_e2e_tests)
+        parser: Parses runner output into (results, passed, failed)
+        resolver: Resolves a list of failed tests (resolve_failed_*)
+        agent_name: Agent name used for run status comments
+        kind: Prefix for log and comment wording ("" or "E2E ")
+
+    Returns:
+        (results, passed_tests, failed_tests, last_test_response)
     """
     attempt = 0
     results = []
-    passed_count = 0
+    passed_tests = []
+    failed_tests = []
     failed_count = 0
+    test_response = None
+    previous_failures = None
 
     while attempt < max_attempts:
         attempt += 1
-        logger.info(f"\n=== E2E Test Run Attempt {attempt}/{max_attempts} ===")
+        logger.info(f"\n=== {kind}Test Run Attempt {attempt}/{max_attempts} ===")
 
-        e2e_response = run_e2e_tests(adw_id, logger, worktree_path)
+        test_response = runner(adw_id, logger, worktree_path)
 
-        if not e2e_response.success:
-            logger.error(f"Error running E2E tests: {e2e_response.output}")
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, AGENT_E2E_TESTER, f"❌ Error running E2E tests: {e2e_response.output}"),
-                )
+        if not test_response.success:
+            logger.error(f"Error running {kind}tests: {test_response.output}")
+            comments.append(
+                format_issue_message(adw_id, agent_name, f"❌ Error running {kind}tests: {test_response.output}")
+            )
             break
 
-        results, passed_count, failed_count = parse_e2e_test_results(e2e_response.output, logger)
+        results, passed_tests, failed_tests = parser(test_response.output, logger)
+        failed_count = len(failed_tests)
 
         if not results:
-            logger.warning("No E2E test results to process")
+            logger.warning(f"No {kind}test results parsed, stopping retry attempts")
             break
-
         if failed_count == 0:
-            logger.info("All E2E tests passed, stopping retry attempts")
+            logger.info(f"All {kind}tests passed, stopping retry attempts")
+            break
+
+        # Another round won't help if the last resolution changed nothing
+        failures = frozenset(test.test_name for test in failed_tests)
+        if failures == previous_failures:
+            logger.info(f"Same {kind}tests failing after resolution, stopping retry attempts")
             break
+        previous_failures = failures
+
         if attempt == max_attempts:
-            logger.info(f"Reached maximum E2E retry attempts ({max_attempts}), stopping")
+            logger.info(f"Reached maximum {kind}retry attempts ({max_attempts}), stopping")
             break
 
-        logger.info("\n=== Attempting to resolve failed E2E tests ===")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(adw_id, "ops", f"🔧 Found {failed_count} failed E2E tests. Attempting resolution..."),
-            )
+        logger.info(f"\n=== Attempting to resolve failed {kind}tests ===")
+        comments.append(
+            format_issue_message(adw_id, "ops", f"🔧 Found {failed_count} failed {kind}tests. Attempting resolution...")
+        )
 
-        failed_tests = [test for test in results if not test.passed]
-        resolved, unresolved = resolve_failed_e2e_tests(
-            failed_tests, adw_id, issue_number, logger, worktree_path, iteration=attempt
+        resolved, unresolved = resolver(
+            failed_tests, adw_id, comments, logger, worktree_path, iteration=attempt, max_workers=max_resolvers
         )
 
         if resolved > 0:
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(adw_id, "ops", f"✅ Resolved {resolved}/{failed_count} failed E2E tests"),
-                )
-            logger.info(f"\n=== Re-running E2E tests after resolving {resolved} tests ===")
-            if issue_number:
-                make_issue_comment(
-                    issue_number,
-                    format_issue_message(
-                        adw_id, AGENT_E2E_TESTER, f"🔄 Re-running E2E tests (attempt {attempt + 1}/{max_attempts})..."
-                    ),
+            comments.append(
+                format_issue_message(adw_id, "ops", f"✅ Resolved {resolved}/{failed_count} failed {kind}tests")
+            )
+            logger.info(f"\n=== Re-running {kind}tests after resolving {resolved} tests ===")
+            comments.append(
+                format_issue_message(
+                    adw_id, agent_name, f"🔄 Re-running {kind}tests (attempt {attempt + 1}/{max_attempts})..."
                 )
+            )
+            comments.flush()
         else:
-            logger.info("No E2E tests were resolved, stopping retry attempts")
+            logger.info(f"No {kind}tests were resolved, stopping retry attempts")
             break
 
     if attempt == max_attempts and failed_count > 0:
-        logger.warning(f"Reached maximum E2E retry attempts ({max_attempts}) with {failed_count} failures remaining")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(
-                    adw_id, "ops", f"⚠️ Reached maximum E2E retry attempts ({max_attempts}) with {failed_count} failures"
-                ),
+        logger.warning(f"Reached maximum {kind}retry attempts ({max_attempts}) with {failed_count} failures remaining")
+        comments.append(
+            format_issue_message(
+                adw_id, "ops", f"⚠️ Reached maximum {kind}retry attempts ({max_attempts}) with {failed_count} failures"
             )
+        )
+
+    return results, passed_tests, failed_tests, test_response
+
 
-    return results, passed_count, failed_count
+def run_tests_with_resolution(
+    adw_id: str,
+    comments: CommentBatcher,
+    logger: logging.Logger,
+    worktree_path: str,
+    max_attempts: int = MAX_TEST_RETRY_ATTEMPTS,
+    max_resolvers: int = MAX_CONCURRENT_TEST_RESOLVERS,
+) -> Tuple[List[TestResult], List[TestResult], List[TestResult], AgentPromptResponse]:
+    """Run tests with automatic resolution and retry logic.
+    Returns (results, passed_tests, failed_tests, last_test_response).
+    """
+    return run_with_resolution(
+        adw_id, comments, logger, worktree_path, max_attempts, max_resolvers,
+        runner=run_tests, parser=parse_test_results, resolver=resolve_failed_tests, agent_name=AGENT_TESTER,
+    )
+
+
+def run_e2e_tests_with_resolution(
+    adw_id: str,
+    comments: CommentBatcher,
+    logger: logging.Logger,
+    worktree_path: str,
+    max_attempts: int = MAX_E2E_TEST_RETRY_ATTEMPTS,
+    max_resolvers: int = MAX_CONCURRENT_TEST_RESOLVERS,
+) -> Tuple[List[E2ETestResult], List[E2ETestResult], List[E2ETestResult]]:
+    """Run E2E tests with automatic resolution and retry logic.
+    Returns (results, passed_tests, failed_tests).
+    """
+    results, passed_tests, failed_tests, _ = run_with_resolution(
+        adw_id, comments, logger, worktree_path, max_attempts, max_resolvers,
+        runner=run_e2e_tests, parser=parse_e2e_test_results, resolver=resolve_failed_e2e_tests,
+        agent_name=AGENT_E2E_TESTER, kind="E2E ",
+    )
+    return results, passed_tests, failed_tests
 
 
 def post_comprehensive_test_summary(
-    issue_number: Optional[str],
+    comments: CommentBatcher,
     adw_id: str,
     results: List[TestResult],
+    failed_tests: List[TestResult],
     e2e_results: List[E2ETestResult],
+    e2e_failed_tests: List[E2ETestResult],
     logger: logging.Logger,
 ):
     """Post a comprehensive test summary including both unit and E2E tests."""
-    if not issue_number:
+    if not comments.issue_id:
         return
 
-    summary = "# 🧪 Comprehensive Test Results\n\n"
+    parts = ["# 🧪 Comprehensive Test Results\n\n"]
 
     # Unit test section
     if results:
-        passed_count = sum(1 for test in results if test.passed)
-        failed_count = len(results) - passed_count
-
-        summary += "## Unit Tests\n\n"
-        summary += f"- **Total**: {len(results)}\n"
-        summary += f"- **Passed**: {passed_count} ✅\n"
-        summary += f"- **Failed**: {failed_count} ❌\n\n"
+        parts.append(
+            f"## Unit Tests\n\n"
+            f"- **Total**: {len(results)}\n"
+            f"- **Passed**: {len(results) - len(failed_tests)} ✅\n"
+            f"- **Failed**: {len(failed_tests)} ❌\n\n"
+        )
 
-        failed_tests = [test for test in results if not test.passed]
         if failed_tests:
-            summary += "### Failed Unit Tests:\n"
-            for test in failed_tests:
-                summary += f"- ❌ {test.test_name}\n"
-            summary += "\n"
+            parts.append("### Failed Unit Tests:\n")
+            parts.extend(f"- ❌ {test.test_name}\n" for test in failed_tests)
+            parts.append("\n")
 
     # E2E test section
     if e2e_results:
-        e2e_passed_count = sum(1 for test in e2e_results if test.passed)
-        e2e_failed_count = len(e2e_results) - e2e_passed_count
-
-        summary += "## E2E Tests\n\n"
-        summary += f"- **Total**: {len(e2e_results)}\n"
-        summary += f"- **Passed**: {e2e_passed_count} ✅\n"
-        summary += f"- **Failed**: {e2e_failed_count} ❌\n\n"
+        parts.append(
+            f"## E2E Tests\n\n"
+            f"- **Total**: {len(e2e_results)}\n"
+            f"- **Passed**: {len(e2e_results) - len(e2e_failed_tests)} ✅\n"
+            f"- **Failed**: {len(e2e_failed_tests)} ❌\n\n"
+        )
 
-        e2e_failed_tests = [test for test in e2e_results if not test.passed]
         if e2e_failed_tests:
-            summary += "### Failed E2E Tests:\n"
+            parts.append("### Failed E2E Tests:\n")
             for result in e2e_failed_tests:
-                summary += f"- ❌ {result.test_name}\n"
+                parts.append(f"- ❌ {result.test_name}\n")
                 if result.screenshots:
-                    summary += f"  - Screenshots: {', '.join(result.screenshots)}\n"
+                    parts.append(f"  - Screenshots: {', '.join(result.screenshots)}\n")
 
     # Overall status
-    failed_count = sum(1 for test in results if not test.passed) if results else 0
-    e2e_failed_count = sum(1 for test in e2e_results if not test.passed) if e2e_results else 0
-    total_failures = failed_count + e2e_failed_count
+    total_failures = len(failed_tests) + len(e2e_failed_tests)
 
     if total_failures > 0:
-        summary += f"\n### ❌ Overall Status: FAILED\n"
-        summary += f"Total failures: {total_failures}\n"
+        parts.append(f"\n### ❌ Overall Status: FAILED\nTotal failures: {total_failures}\n")
     else:
         total_tests = len(results) + len(e2e_results)
-        summary += f"\n### ✅ Overall Status: PASSED\n"
-        summary += f"All {total_tests} tests passed successfully!\n"
-
-    make_issue_comment(issue_number, format_issue_message(adw_id, "test_summary", summary))
-    logger.info(f"Posted comprehensive test results summary to issue #{issue_number}")
-
+        parts.append(f"\n### ✅ Overall Status: PASSED\nAll {total_tests} tests passed successfully!\n")
 
-def main():
-    """Main entry point."""
-    load_dotenv()
+    summary = "".join(parts)
+    comments.append(format_issue_message(adw_id, "test_summary", summary))
+    comments.flush()
+    logger.info(f"Posted comprehensive test results summary to issue #{comments.issue_id}")
 
-    parser = argparse.ArgumentParser(description="ADW Test - Automated testing workflow")
-    parser.add_argument("--adw-id", required=True, help="Workflow ID")
-    parser.add_argument("--issue-number", help="GitHub issue number (optional)")
-    parser.add_argument("--skip-e2e", action="store_true", help="Skip E2E tests")
-    args = parser.parse_args()
 
-    adw_id = args.adw_id
-    issue_number = args.issue_number
-    skip_e2e = args.skip_e2e
-
-    # Load state
-    logger = setup_logger(adw_id, "adw_test")
-    state = ADWState.load(adw_id, logger)
-
-    if not state:
-        logger.error(f"No state found for ADW ID: {adw_id}")
-        print(f"Error: No state found for ADW ID: {adw_id}")
-        print("Run adw_planning.py first to create the worktree and state")
-        sys.exit(1)
-
-    logger.info(f"ADW Test starting - ID: {adw_id}, Issue: {issue_number}, Skip E2E: {skip_e2e}")
+def run_test_phase(
+    state: ADWState,
+    adw_id: str,
+    issue_number: Optional[str],
+    skip_e2e: bool,
+    max_resolvers: int,
+    logger: logging.Logger,
+    comments: CommentBatcher,
+) -> None:
+    """Run unit and E2E tests with resolution, then commit the results.
+
+    State changes are not saved here; main() runs this inside state.batch().
+
+    Args:
+        state: Loaded ADW state
+        adw_id: ADW workflow ID
+        issue_number: GitHub issue number (optional)
+        skip_e2e: Skip E2E tests
+        max_resolvers: Maximum number of failed-test resolvers to run at once
+        logger: Logger instance
+        comments: Batcher that coalesces issue status comments
+    """
+    # git_ops and worktree_ops aren't needed by the helpers above, so they
+    # are only loaded when the phase actually runs
+    from adws.adw_modules.git_ops import commit_changes, finalize_git_operations
+    from adws.adw_modules.worktree_ops import validate_worktree
 
     # Validate worktree exists
     valid, error = validate_worktree(adw_id, state)
     if not valid:
         logger.error(f"Worktree validation failed: {error}")
         print(f"Error: Worktree validation failed: {error}")
-        if issue_number:
-            make_issue_comment(
-                issue_number,
-                format_issue_message(adw_id, "ops", f"❌ Worktree validation failed: {error}\nRun adw_planning.py first"),
-            )
+        comments.append(
+            format_issue_message(adw_id, "ops", f"❌ Worktree validation failed: {error}\nRun adw_planning.py first")
+        )
         sys.exit(1)
 
     worktree_path = state.get("worktree_path")
@@ -564,61 +588,60 @@ def main():
     backend_port = state.get("backend_port", "9100")
     frontend_port = state.get("frontend_port", "9200")
 
-    if issue_number:
-        make_issue_comment(
-            issue_number,
-            format_issue_message(
-                adw_id,
-                "ops",
-                f"✅ Starting isolated testing phase\n"
-                f"🏠 Worktree: {worktree_path}\n"
-                f"🔌 Ports - Backend: {backend_port}, Frontend: {frontend_port}\n"
-                f"🧪 E2E Tests: {'Skipped' if skip_e2e else 'Enabled'}",
-            ),
+    comments.append(
+        format_issue_message(
+            adw_id,
+            "ops",
+            f"✅ Starting isolated testing phase\n"
+            f"🏠 Worktree: {worktree_path}\n"
+            f"🔌 Ports - Backend: {backend_port}, Frontend: {frontend_port}\n"
+            f"🧪 E2E Tests: {'Skipped' if skip_e2e else 'Enabled'}",
         )
+    )
 
     # Run unit tests with resolution
     logger.info("Running unit tests in worktree with automatic resolution")
-    if issue_number:
-        make_issue_comment(
-            issue_number, format_issue_message(adw_id, AGENT_TESTER, "🧪 Running unit tests in isolated environment...")
-        )
+    comments.append(
+        format_issue_message(adw_id, AGENT_TESTER, "🧪 Running unit tests in isolated environment...")
+    )
+    comments.flush()
 
-    results, passed_count, failed_count, test_response = run_tests_with_resolution(adw_id, issue_number, logger, worktree_path)
+    results, passed_tests, failed_tests, test_response = run_tests_with_resolution(
+        adw_id, comments, logger, worktree_path, max_resolvers=max_resolvers
+    )
+    failed_count = len(failed_tests)
 
     if results:
-        comment = format_test_results_comment(results, passed_count, failed_count)
-        if issue_number:
-            make_issue_comment(issue_number, format_issue_message(adw_id, AGENT_TESTER, comment))
-        logger.info(f"Test results: {passed_count} passed, {failed_count} failed")
+        comment = format_test_results_comment(results, passed_tests, failed_tests)
+        comments.append(format_issue_message(adw_id, AGENT_TESTER, comment))
+        logger.info(f"Test results: {len(passed_tests)} passed, {failed_count} failed")
     else:
         logger.warning("No test results found in output")
-        if issue_number:
-            make_issue_comment(
-                issue_number, format_issue_message(adw_id, AGENT_TESTER, "⚠️ No test results found in output")
-            )
+        comments.append(format_issue_message(adw_id, AGENT_TESTER, "⚠️ No test results found in output"))
 
     # Run E2E tests if not skipped
     e2e_results = []
-    e2e_passed = 0
-    e2e_failed = 0
+    e2e_passed_tests = []
+    e2e_failed_tests = []
     if not skip_e2e:
         logger.info("Running E2E tests in worktree with automatic resolution")
-        if issue_number:
-            make_issue_comment(
-                issue_number, format_issue_message(adw_id, AGENT_E2E_TESTER, "🌐 Running E2E tests in isolated environment...")
-            )
+        comments.append(
+            format_issue_message(adw_id, AGENT_E2E_TESTER, "🌐 Running E2E tests in isolated environment...")
+        )
+        comments.flush()
 
-        e2e_results, e2e_passed, e2e_failed = run_e2e_tests_with_resolution(adw_id, issue_number, logger, worktree_path)
+        e2e_results, e2e_passed_tests, e2e_failed_tests = run_e2e_tests_with_resolution(
+            adw_id, comments, logger, worktree_path, max_resolvers=max_resolvers
+        )
 
         if e2e_results:
-            logger.info(f"E2E test results: {e2e_passed} passed, {e2e_failed} failed")
+            logger.info(f"E2E test results: {len(e2e_passed_tests)} passed, {len(e2e_failed_tests)} failed")
 
     # Post comprehensive summary
-    post_comprehensive_test_summary(issue_number, adw_id, results, e2e_results, logger)
+    post_comprehensive_test_summary(comments, adw_id, results, failed_tests, e2e_results, e2e_failed_tests, logger)
 
     # Check total failures
-    total_failures = failed_count + (e2e_failed if not skip_e2e and e2e_results else 0)
+    total_failures = failed_count + len(e2e_failed_tests)
     if total_failures > 0:
         logger.warning(f"Tests completed with {total_failures} failures - continuing to commit results")
 
@@ -639,7 +662,6 @@ def main():
                     issue_command = "/feature"
                 else:
                     state.update(issue_class=issue_command)
-                    state.save("adw_test")
 
             # Create commit
             logger.info("Creating test commit")
@@ -647,10 +669,9 @@ def main():
 
             if error:
                 logger.error(f"Error creating commit message: {error}")
-                if issue_number:
-                    make_issue_comment(
-                        issue_number, format_issue_message(adw_id, AGENT_TESTER, f"❌ Error creating commit message: {error}")
-                    )
+                comments.append(
+                    format_issue_message(adw_id, AGENT_TESTER, f"❌ Error creating commit message: {error}")
+                )
                 sys.exit(1)
 
             # Commit changes
@@ -658,42 +679,76 @@ def main():
 
             if not success:
                 logger.error(f"Error committing test results: {error}")
-                make_issue_comment(
-                    issue_number, format_issue_message(adw_id, AGENT_TESTER, f"❌ Error committing test results: {error}")
+                comments.append(
+                    format_issue_message(adw_id, AGENT_TESTER, f"❌ Error committing test results: {error}")
                 )
                 sys.exit(1)
 
             logger.info(f"Committed test results: {commit_msg}")
-            make_issue_comment(issue_number, format_issue_message(adw_id, AGENT_TESTER, "✅ Test results committed"))
+            comments.append(format_issue_message(adw_id, AGENT_TESTER, "✅ Test results committed"))
 
             # Finalize git operations
             finalize_git_operations(state, logger, cwd=worktree_path)
 
         except Exception as e:
             logger.error(f"Error in git operations: {e}")
-            if issue_number:
-                make_issue_comment(issue_number, format_issue_message(adw_id, "ops", f"❌ Error in git operations: {e}"))
+            comments.append(format_issue_message(adw_id, "ops", f"❌ Error in git operations: {e}"))
 
     # Update state
     state.update_phase("test", completed=(total_failures == 0), failed_count=total_failures)
-    state.save("adw_test")
 
     logger.info("Isolated testing phase completed")
-    if issue_number:
-        make_issue_comment(issue_number, format_issue_message(adw_id, "ops", "✅ Isolated testing phase completed"))
+    comments.append(format_issue_message(adw_id, "ops", "✅ Isolated testing phase completed"))
 
     # Exit with appropriate code
     if total_failures > 0:
         logger.error(f"Test workflow completed with {total_failures} failures")
-        if issue_number:
-            make_issue_comment(
-                issue_number, format_issue_message(adw_id, "ops", f"❌ Test workflow completed with {total_failures} failures")
-            )
+        comments.append(
+            format_issue_message(adw_id, "ops", f"❌ Test workflow completed with {total_failures} failures")
+        )
         sys.exit(1)
     else:
         logger.info("All tests passed successfully")
-        if issue_number:
-            make_issue_comment(issue_number, format_issue_message(adw_id, "ops", "✅ All tests passed successfully!"))
+        comments.append(format_issue_message(adw_id, "ops", "✅ All tests passed successfully!"))
+
+
+def main():
+    """Main entry point."""
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="ADW Test - Automated testing workflow")
+    parser.add_argument("--adw-id", required=True, help="Workflow ID")
+    parser.add_argument("--issue-number", help="GitHub issue number (optional)")
+    parser.add_argument("--skip-e2e", action="store_true", help="Skip E2E tests")
+    parser.add_argument(
+        "--parallel-resolution",
+        action="store_true",
+        help="Resolve failed tests concurrently (only safe when fixes touch disjoint files)",
+    )
+    args = parser.parse_args()
+
+    adw_id = args.adw_id
+    issue_number = args.issue_number
+    skip_e2e = args.skip_e2e
+    max_resolvers = PARALLEL_TEST_RESOLVERS if args.parallel_resolution else MAX_CONCURRENT_TEST_RESOLVERS
+
+    # Load state
+    logger = setup_logger(adw_id, "adw_test")
+    state = ADWState.load(adw_id, logger)
+
+    if not state:
+        logger.error(f"No state found for ADW ID: {adw_id}")
+        print(f"Error: No state found for ADW ID: {adw_id}")
+        print("Run adw_planning.py first to create the worktree and state")
+        sys.exit(1)
+
+    logger.info(f"ADW Test starting - ID: {adw_id}, Issue: {issue_number}, Skip E2E: {skip_e2e}")
+
+    # Status updates are queued and posted as coalesced comments from a
+    # background thread; each test run and the final summary are flushed
+    # eagerly. Every state change in the run is written once, atomically, on exit
+    with state.batch("adw_test"), CommentBatcher(issue_number, background=True) as comments:
+        run_test_phase(state, adw_id, issue_number, skip_e2e, max_resolvers, logger, comments)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +22,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from adws.adw_modules.state import ADWState
 
+# Test output subdirectories under agents/{adw_id}/ui_reviewer_agent
+UI_REVIEW_SUBDIRS = ("e2e_tests", "videos", "screenshots")
+
 
 def main():
     """Main entry point for UI reviewer agent."""
@@ -51,12 +55,10 @@ def main():
     state.update_phase("ui_review", started=True, app_url=args.app_url)
     state.save()
 
-    # Create test output directories
+    # Create test output directories (parents=True creates test_dir itself)
     test_dir = Path(f"agents/{args.adw_id}/ui_reviewer_agent")
-    test_dir.mkdir(parents=True, exist_ok=True)
-    (test_dir / "e2e_tests").mkdir(exist_ok=True)
-    (test_dir / "videos").mkdir(exist_ok=True)
-    (test_dir / "screenshots").mkdir(exist_ok=True)
+    for name in UI_REVIEW_SUBDIRS:
+        (test_dir / name).mkdir(parents=True, exist_ok=True)
 
     print(f"\n📄 Reading user flows from: {user_flows}")
     print(f"\n🚧 This is a template script!")
@@ -80,9 +82,11 @@ def main():
         "status": "not_run"
     }
 
+    # Write to a temporary file first so a crash never leaves a truncated report
     report_path = test_dir / "test_report.json"
-    with open(report_path, 'w') as f:
-        json.dump(test_report, f, indent=2)
+    tmp_path = report_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(test_report, indent=2), encoding="utf-8")
+    os.replace(tmp_path, report_path)
 
     # Update state
     state.update_phase(